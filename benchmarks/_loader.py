@@ -0,0 +1,24 @@
+"""Load integration modules without importing Home Assistant.
+
+The package __init__ pulls in Home Assistant, so the benchmarks register a
+bare package object pointing at the integration directory and import the
+HA-free submodules (const, menu_parser, ...) through it.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "bessa_lunch"
+PACKAGE_NAME = "bessa_lunch_bench"
+
+
+def load(module: str) -> types.ModuleType:
+    """Import a submodule of the integration, e.g. load("menu_parser")."""
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [str(PACKAGE_DIR)]
+        sys.modules[PACKAGE_NAME] = package
+    return importlib.import_module(f"{PACKAGE_NAME}.{module}")
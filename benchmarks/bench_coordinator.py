@@ -0,0 +1,171 @@
+"""End-to-end refresh benchmark against the local fake Bessa server.
+
+Usage:
+    python benchmarks/bench_coordinator.py [--latency S] [--orders N]
+        [--page-size N] [--menu-items N] [--error-rate R] [--rounds N]
+
+Drives BessaAPIClient through a full refresh (orders + 7 menus) in three
+ways: serially (the original coordinator behaviour), concurrently on a
+cold client, and concurrently on a warm client (menu cache, conditional
+requests and incremental order sync in effect). When Home Assistant is
+installed the real coordinators are refreshed as well. Reports wall time
+and the number of requests per endpoint.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import aiohttp
+
+import _loader
+from fake_bessa_server import FakeBessaServer
+
+bessa_api = _loader.load("bessa_api")
+const = _loader.load("const")
+
+
+def _target_dates() -> list[str]:
+    today = datetime.now().date()
+    return [
+        (today + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
+        for days_ahead in range(const.MENU_DAYS)
+    ]
+
+
+def _make_client(session: aiohttp.ClientSession, base_url: str):
+    return bessa_api.BessaAPIClient(
+        username="bench@bessa.app",
+        password="secret",
+        venue_id=1,
+        session=session,
+        base_url=base_url,
+    )
+
+
+async def refresh_serial(client) -> None:
+    """Orders, then one menu after another."""
+    await client.get_today_orders()
+    for date in _target_dates():
+        await client.get_menu(date)
+
+
+async def refresh_concurrent(client) -> None:
+    """Orders and all menus at once behind the coordinator's semaphore."""
+    semaphore = asyncio.Semaphore(const.DEFAULT_MAX_CONCURRENT_REQUESTS)
+
+    async def _limited(coro):
+        async with semaphore:
+            return await coro
+
+    await client.ensure_authenticated()
+    await asyncio.gather(
+        _limited(client.get_today_orders()),
+        *(_limited(client.get_menu(date)) for date in _target_dates()),
+        return_exceptions=True,
+    )
+
+
+async def _measure(server: FakeBessaServer, name: str, run, rounds: int) -> None:
+    """Run a refresh callable several times and print timing and request counts."""
+    samples = []
+    server.requests.clear()
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - start) * 1000)
+    requests = dict(sorted(server.requests.items()))
+    per_round = sum(requests.values()) / rounds
+    print(
+        f"{name:<30} median {statistics.median(samples):8.1f} ms  "
+        f"max {max(samples):8.1f} ms  {per_round:5.1f} req/refresh  {requests}"
+    )
+
+
+async def bench_client(server: FakeBessaServer, rounds: int) -> None:
+    """Benchmark the API client refresh strategies."""
+    async with aiohttp.ClientSession() as session:
+
+        async def serial_cold() -> None:
+            await refresh_serial(_make_client(session, server.base_url))
+
+        async def concurrent_cold() -> None:
+            await refresh_concurrent(_make_client(session, server.base_url))
+
+        warm_client = _make_client(session, server.base_url)
+        await refresh_concurrent(warm_client)
+
+        async def concurrent_warm() -> None:
+            await refresh_concurrent(warm_client)
+
+        await _measure(server, "client serial (cold)", serial_cold, rounds)
+        await _measure(server, "client concurrent (cold)", concurrent_cold, rounds)
+        await _measure(server, "client concurrent (warm)", concurrent_warm, rounds)
+
+
+async def bench_coordinators(server: FakeBessaServer, rounds: int) -> None:
+    """Benchmark the real coordinators if Home Assistant is installed."""
+    try:
+        from homeassistant.core import HomeAssistant
+    except ImportError:
+        print("homeassistant not installed, skipping coordinator benchmark")
+        return
+
+    coordinator = _loader.load("coordinator")
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entry = SimpleNamespace(entry_id="bench")
+        async with aiohttp.ClientSession() as session:
+            client = _make_client(session, server.base_url)
+            menus = coordinator.BessaLunchMenusCoordinator(hass, client.venue_id, client)
+            orders = coordinator.BessaLunchOrdersCoordinator(hass, entry, client, menus)
+
+            async def refresh() -> None:
+                await menus.async_refresh()
+                await orders.async_refresh()
+
+            await _measure(server, "coordinators (cold+warm)", refresh, rounds)
+        await hass.async_stop(force=True)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Start the fake server and run all benchmarks."""
+    server = FakeBessaServer(
+        latency=args.latency,
+        page_size=args.page_size,
+        orders=args.orders,
+        menu_items=args.menu_items,
+        error_rate=args.error_rate,
+    )
+    await server.start()
+    print(
+        f"fake server {server.base_url}: latency {args.latency * 1000:.0f} ms, "
+        f"{args.orders} orders, page size {args.page_size}, "
+        f"{args.menu_items} menu items, error rate {args.error_rate:.0%}\n"
+    )
+    try:
+        await bench_client(server, args.rounds)
+        await bench_coordinators(server, args.rounds)
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--orders", type=int, default=10)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--menu-items", type=int, default=8)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark JSON decoding of representative Bessa API payloads.
+
+Usage:
+    python benchmarks/bench_json.py [--repeat N]
+
+Compares the stdlib decoder with orjson (when installed) and with the
+decoder the API client actually picked, on a login response, a menu day,
+a large menu day and full order pages. Payloads come from the fake server,
+so no network access or Home Assistant is needed.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+
+import _loader
+from fake_bessa_server import TOKEN, FakeBessaServer
+
+bessa_api = _loader.load("bessa_api")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _payloads() -> dict[str, bytes]:
+    """Return encoded responses as the API would send them."""
+    server = FakeBessaServer(orders=20)
+    large = FakeBessaServer(menu_items=40)
+    return {
+        "login": json.dumps({"key": TOKEN}).encode(),
+        "menu day (8 items)": json.dumps(server._menu("2026-01-05")).encode(),
+        "menu day (40 items)": json.dumps(large._menu("2026-01-05")).encode(),
+        "orders page (20)": json.dumps(
+            {"next": None, "previous": None, "results": server.orders}
+        ).encode(),
+        "orders page (100)": json.dumps(
+            {"next": None, "previous": None, "results": FakeBessaServer(orders=100).orders}
+        ).encode(),
+    }
+
+
+def _time_per_call(func: Callable[[], object], repeat: int) -> float:
+    """Return the median time of one call in microseconds."""
+    samples = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        samples.append((time.perf_counter() - start) / repeat)
+    return statistics.median(samples) * 1e6
+
+
+def main() -> None:
+    """Run the JSON decoding benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000, help="calls per timing sample")
+    args = parser.parse_args()
+
+    decoders: dict[str, Callable[[bytes], object]] = {"json": json.loads}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    else:
+        print("orjson not installed, only timing the stdlib decoder")
+    print(f"client decoder: {bessa_api.json_loads.__module__}.{bessa_api.json_loads.__name__}\n")
+
+    names = list(decoders)
+    print(f"{'payload':<22} {'bytes':>7} " + " ".join(f"{n + ' us':>11}" for n in names)
+          + (f" {'speedup':>8}" if len(names) > 1 else ""))
+    for label, body in _payloads().items():
+        timings = [_time_per_call(lambda d=d: d(body), args.repeat) for d in decoders.values()]
+        row = f"{label:<22} {len(body):>7} " + " ".join(f"{t:>11.2f}" for t in timings)
+        if len(timings) > 1:
+            row += f" {timings[0] / timings[1]:>7.1f}x"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark the menu description parser on the offline corpus.
+
+Usage:
+    python benchmarks/bench_parser.py [--repeat N] [--group NAME]
+
+Reports per-description parse time, overall throughput and peak memory
+allocated per call for the uncached parser, the LRU-cached entry point and
+the tokenizer on the hot path. Runs without network access or Home Assistant.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import _loader
+from corpus import ALL_DESCRIPTIONS, CORPUS, menu_items
+
+menu_parser = _loader.load("menu_parser")
+
+
+def _time_per_call(func: Callable[[], object], repeat: int) -> float:
+    """Return the median time of one call in microseconds."""
+    samples = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        samples.append((time.perf_counter() - start) / repeat)
+    return statistics.median(samples) * 1e6
+
+
+def _peak_bytes(func: Callable[[], object]) -> int:
+    """Return the peak memory allocated during one call, via tracemalloc."""
+    func()  # warm up caches, interned strings and regex compilation
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+def bench_descriptions(groups: dict[str, list[str]], repeat: int) -> None:
+    """Time the uncached parser for every description in the corpus."""
+    print(f"{'group':<22} {'#':>2} {'len':>4} {'us/parse':>9} {'peak B':>7}")
+    total_time = 0.0
+    count = 0
+    for group, descriptions in groups.items():
+        for index, description in enumerate(descriptions):
+            func = lambda d=description: menu_parser._parse_menu_description(d)
+            per_call = _time_per_call(func, repeat)
+            peak = _peak_bytes(func)
+            total_time += per_call
+            count += 1
+            print(
+                f"{group:<22} {index:>2} {len(description):>4} "
+                f"{per_call:>9.2f} {peak:>7}"
+            )
+    if count:
+        print(f"\nuncached: {count} descriptions, mean {total_time / count:.2f} us, "
+              f"throughput {count / total_time * 1e6:,.0f} descriptions/s")
+
+
+def bench_entry_points(repeat: int) -> None:
+    """Time the cached parser, the M6 pass, the batch API and the tokenizer."""
+    items = menu_items()
+    descriptions = ALL_DESCRIPTIONS
+
+    def parse_all_cached() -> None:
+        for description in descriptions:
+            menu_parser.parse_menu_description(description)
+
+    def parse_all_uncached() -> None:
+        for description in descriptions:
+            menu_parser._parse_menu_description(description)
+
+    def fill_m6() -> None:
+        day = [item.description for item in items]
+        parsed = [menu_parser.parse_menu_description(d) for d in day]
+        menu_parser.fill_m6_from_reference(day, parsed)
+
+    def parse_menu() -> None:
+        menu_parser.parse_menu([item.description for item in items])
+
+    week = {f"menu_2026-01-{day:02d}": items for day in range(5, 12)}
+
+    def parse_week() -> None:
+        menu_parser.parse_menus(week)
+
+    def tokenize() -> None:
+        for description in descriptions:
+            menu_parser._tokenize(description)
+
+    def token_scan() -> None:
+        for description in descriptions:
+            list(menu_parser._TOKEN_RE.finditer(description))
+
+    cases = {
+        "parse corpus (uncached)": parse_all_uncached,
+        "parse corpus (LRU cached)": parse_all_cached,
+        "parse + M6 fill (menu day)": fill_m6,
+        "parse_menu (menu day)": parse_menu,
+        "parse_menus (7 days)": parse_week,
+        "_tokenize (corpus)": tokenize,
+        "_TOKEN_RE.finditer (corpus)": token_scan,
+    }
+    print(f"\n{'case':<34} {'us/run':>9} {'peak B':>8}")
+    for name, func in cases.items():
+        per_call = _time_per_call(func, max(1, repeat // 10))
+        print(f"{name:<34} {per_call:>9.2f} {_peak_bytes(func):>8}")
+    print(f"\nparser cache: {menu_parser.parser_cache_info()}")
+
+
+def main() -> None:
+    """Run the parser benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000, help="calls per timing sample")
+    parser.add_argument("--group", choices=sorted(CORPUS), help="only this corpus group")
+    args = parser.parse_args()
+
+    groups = {args.group: CORPUS[args.group]} if args.group else CORPUS
+    bench_descriptions(groups, args.repeat)
+    bench_entry_points(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
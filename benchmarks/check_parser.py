@@ -0,0 +1,76 @@
+"""Check the menu description parser against the frozen reference copy.
+
+Usage:
+    python benchmarks/check_parser.py [--random N] [--seed S]
+
+Parses every corpus description plus N random descriptions, built by
+recombining corpus fragments with allergen codes, slashes, commas and
+semicolons, with both the integration's parser and reference_parser.py and
+reports any description where the results differ. Exits with status 1 on
+a mismatch. Runs without network access or Home Assistant.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+
+import _loader
+import reference_parser
+from corpus import ALL_DESCRIPTIONS
+
+menu_parser = _loader.load("menu_parser")
+
+_EXTRA_PIECES = [
+    "(A)", "(ACG)", "(A/G/L)", "ACG)", "/L)", "/GL", "(GL", "(", "/", " / ", ", ",
+    ",", ";", "; ", "  ", " ", "\t", "Suppe / Soup", "Salat / Salad", "Dessert",
+    "kleiner Salat", "mit", "and", "Ä", "ÖL)", "X", "AB", "dessert",
+]
+
+
+def _random_descriptions(count: int, seed: int) -> list[str]:
+    """Return descriptions made of random corpus fragments and separators."""
+    rng = random.Random(seed)
+    pieces = [
+        piece
+        for description in ALL_DESCRIPTIONS
+        for piece in re.split(r"(\([^)]*\)|/|, |;|\s+)", description)
+        if piece
+    ] + _EXTRA_PIECES
+    descriptions = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            # Mutate a real description so the structure stays mostly intact
+            parts = re.split(r"(\([^)]*\)|/|, |;|\s+)", rng.choice(ALL_DESCRIPTIONS))
+            for _ in range(rng.randint(1, 4)):
+                parts[rng.randrange(len(parts))] = rng.choice(pieces)
+        else:
+            parts = [rng.choice(pieces) for _ in range(rng.randint(1, 30))]
+        descriptions.append("".join(parts))
+    return descriptions
+
+
+def main() -> None:
+    """Run the parser equivalence check."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--random", type=int, default=20000, help="random descriptions")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    descriptions = ["", " "] + ALL_DESCRIPTIONS + _random_descriptions(args.random, args.seed)
+    mismatches = 0
+    for description in descriptions:
+        expected = reference_parser._parse_menu_description(description)
+        actual = menu_parser._parse_menu_description(description)
+        if actual != expected:
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"MISMATCH {description!r}\n  expected {expected}\n  actual   {actual}")
+
+    print(f"{len(descriptions)} descriptions checked, {mismatches} mismatches")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
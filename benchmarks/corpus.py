@@ -0,0 +1,87 @@
+"""Anonymized Bessa menu descriptions grouped by encoding format.
+
+The dishes are made up, but the structure (allergen code placement,
+slashes, commas, semicolons, merged segments) mirrors descriptions seen
+in production menus.
+"""
+import _loader
+
+FORMAT_A = [
+    "Karfiolcremesuppe / Cauliflower cream soup(ACG) Schweinsbraten mit Serviettenknödel / "
+    "Roast pork with bread dumplings(ACGL) Apfelstrudel / Apple strudel(ACG)",
+    "Frittatensuppe / Pancake soup(ACGL) Gemüselasagne / Vegetable lasagne(ACG) "
+    "Topfencreme mit Beeren / Curd cream with berries(G)",
+    "Kürbissuppe / Pumpkin soup(G) Hühnerkeule mit Reis / Chicken leg with rice(L) "
+    "Schokomousse / Chocolate mousse(CG)",
+    "Tomatensuppe / Tomato soup(A/G) Rindsgulasch mit Semmel / Beef goulash with bread roll(A/L/M) "
+    "Obstsalat / Fruit salad(O)",
+]
+
+FORMAT_B = [
+    "Grießnockerlsuppe(ACG) Wiener Schnitzel mit Erdäpfelsalat(ACGM) Marillenknödel(ACG) "
+    "semolina dumpling soup, Viennese schnitzel with potato salad, apricot dumplings",
+    "Linsensuppe(L) Kaspressknödel mit Sauerkraut(ACG) Vanillepudding(G) "
+    "lentil soup; cheese dumplings with sauerkraut; vanilla pudding",
+    "Erbsensuppe(G) Zucchini-Risotto(GL) Joghurtcreme(G) "
+    "pea soup, zucchini risotto, yoghurt cream",
+]
+
+FORMAT_C = [
+    "Gulaschsuppe(L) goulash soup, Spinatstrudel mit Kräuterdip(ACG) Germknödel(ACG) "
+    "spinach strudel with herb dip, yeast dumpling",
+    "Zwiebelsuppe(AL) onion soup, Putengeschnetzeltes mit Nudeln(ACG) Kaiserschmarrn(ACG) "
+    "turkey strips with noodles, shredded pancake",
+]
+
+MERGED_BILINGUAL = [
+    "Karfiolcremesuppe / Cauliflower cream soup Brokkoli- Mandelrisotto / "
+    "Broccoli almond risotto(GH) Birnenkuchen / Pear cake(ACG)",
+    "Rindsuppe mit Nudeln / Beef soup with noodles Faschierter Braten / "
+    "Meat loaf(ACGLM) Mohnnudeln / Poppy seed noodles(ACG)",
+]
+
+SINGLE_BILINGUAL = [
+    "Fischstäbchen mit Kartoffelpüree / Fish fingers with mashed potatoes",
+    "Käsespätzle mit Röstzwiebeln / Cheese spaetzle with fried onions",
+    "Gemüsecurry mit Basmatireis / Vegetable curry with basmati rice",
+]
+
+M6 = [
+    "Suppe / Soup  Salat / Salad  Dessert",
+    "kleiner Salat mit Suppe und Dessert / small salad with soup and dessert",
+]
+
+INGREDIENT_LEVEL_ALLERGENS = [
+    "Bohnensuppe / Bean soup(L) Hendl(A) mit Polenta(G) und Ratatouille / "
+    "Chicken with polenta and ratatouille(L) Früchtejoghurt / Fruit yoghurt(G)",
+]
+
+CORPUS = {
+    "format_a": FORMAT_A,
+    "format_b": FORMAT_B,
+    "format_c": FORMAT_C,
+    "merged_bilingual": MERGED_BILINGUAL,
+    "single_bilingual": SINGLE_BILINGUAL,
+    "m6": M6,
+    "ingredient_allergens": INGREDIENT_LEVEL_ALLERGENS,
+}
+
+ALL_DESCRIPTIONS = [description for group in CORPUS.values() for description in group]
+
+
+def menu_items(descriptions: list[str] | None = None) -> tuple:
+    """Build menu items (as produced by BessaAPIClient.get_menu) for descriptions."""
+    models = _loader.load("models")
+    descriptions = ALL_DESCRIPTIONS if descriptions is None else descriptions
+    return tuple(
+        models.MenuItem(
+            id=index,
+            name=f"M{index + 1}",
+            description=description,
+            price=5.9,
+            allergens="",
+            available=42,
+            category="Mittagsmenü",
+        )
+        for index, description in enumerate(descriptions)
+    )
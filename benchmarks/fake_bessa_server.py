@@ -0,0 +1,240 @@
+"""Local stand-in for api.bessa.app used by the benchmarks.
+
+Implements the endpoints the integration talks to:
+
+    POST  /v1/auth/login/
+    GET   /v1/user/orders                     (paginated, filterable)
+    PATCH /v1/user/orders/{id}/cancel/
+    GET   /v1/venues/{venue}/menu/{type}/{date}/
+
+Latency, page size and error injection are configurable, responses carry
+ETag headers and honour If-None-Match, and every request is counted so the
+benchmarks can report request volume next to wall time.
+
+Run standalone with:
+    python benchmarks/fake_bessa_server.py --port 8765 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from aiohttp import web
+
+from corpus import ALL_DESCRIPTIONS
+
+TOKEN = "0123456789abcdef0123456789abcdef01234567"
+
+
+class FakeBessaServer:
+    """In-memory Bessa API with configurable latency and failures."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        page_size: int = 20,
+        orders: int = 10,
+        menu_items: int = 8,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the server state."""
+        self.latency = latency
+        self.page_size = page_size
+        self.error_rate = error_rate
+        self.requests: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+        self.orders = self._make_orders(orders)
+        self._menu_items = menu_items
+
+    @staticmethod
+    def _timestamp(moment: datetime | None = None) -> str:
+        """Return a UTC timestamp in the one format the API uses throughout.
+
+        A fixed format keeps the timestamps sortable as strings, which the
+        client relies on for its updated__gte watermark.
+        """
+        moment = moment or datetime.now(timezone.utc)
+        return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    @classmethod
+    def _make_orders(cls, count: int) -> list[dict[str, Any]]:
+        """Create orders spread over the last week and the coming days."""
+        noon = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        now = datetime.now(timezone.utc)
+        orders = []
+        for index in range(count):
+            pickup = noon + timedelta(days=(index % 12) - 5)
+            # Always in the past, so later changes sort after every one of them
+            updated = cls._timestamp(now - timedelta(hours=index + 1))
+            orders.append({
+                "id": 1000 + index,
+                "venue": 1,
+                "order_type": 7,
+                "order_state": 5,
+                "states": [{"state": 5, "timestamp": updated}],
+                "date": pickup.isoformat() + "Z",
+                "total": "5.90",
+                "currency": "EUR",
+                "pickup_code": f"A{index:03d}",
+                "number": index,
+                "payment_method": "invoice",
+                "items": [{
+                    "id": index,
+                    "name": f"M{index % 6 + 1}",
+                    "description": ALL_DESCRIPTIONS[index % len(ALL_DESCRIPTIONS)],
+                    "price": "5.90",
+                    "amount": 1,
+                    "vat": "10.00",
+                    "article": 1,
+                }],
+                "created": updated,
+                "updated": updated,
+                "deleted": None,
+            })
+        return orders
+
+    def _menu(self, date: str) -> dict[str, Any]:
+        """Return a menu response for a date."""
+        items = [
+            {
+                "id": index,
+                "name": f"M{index + 1}",
+                "description": ALL_DESCRIPTIONS[index % len(ALL_DESCRIPTIONS)],
+                "price": "5.90",
+                "allergens": "ACG",
+                "available_amount": str(100 - index),
+                "sort": index,
+            }
+            for index in range(self._menu_items)
+        ]
+        return {
+            "next": None,
+            "previous": None,
+            "results": [{"id": 1, "name": "Mittagsmenü", "items": items, "sort": 0}],
+            "date": date,
+        }
+
+    # Request handling
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        """Count requests, add latency, inject errors and check auth."""
+        self.requests[request.match_info.route.name or request.path] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise web.HTTPInternalServerError(text="injected failure")
+        if request.path != "/v1/auth/login/":
+            if request.headers.get("Authorization") != f"Token {TOKEN}":
+                raise web.HTTPUnauthorized()
+        return await handler(request)
+
+    @staticmethod
+    def _json(request: web.Request, payload: Any) -> web.Response:
+        """Return JSON with an ETag, or 304 if the client already has it."""
+        body = json.dumps(payload).encode()
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+    async def _login(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        if not data.get("email") or not data.get("password"):
+            return web.json_response({"non_field_errors": ["Invalid credentials"]}, status=400)
+        return web.json_response({"key": TOKEN})
+
+    async def _orders(self, request: web.Request) -> web.Response:
+        query = request.query
+        orders = self.orders
+        if "date__gte" in query:
+            orders = [o for o in orders if o["date"][:10] >= query["date__gte"][:10]]
+        if "updated__gte" in query:
+            orders = [o for o in orders if o["updated"] >= query["updated__gte"]]
+        if query.get("deleted__isnull") == "true":
+            orders = [o for o in orders if not o["deleted"]]
+        if query.get("ordering") == "-date":
+            orders = sorted(orders, key=lambda o: o["date"], reverse=True)
+
+        page = int(query.get("page", 1))
+        start = (page - 1) * self.page_size
+        results = orders[start:start + self.page_size]
+        next_url = None
+        if start + self.page_size < len(orders):
+            next_url = str(request.url.update_query(page=page + 1))
+        return self._json(request, {"next": next_url, "previous": None, "results": results})
+
+    async def _cancel(self, request: web.Request) -> web.Response:
+        order_id = int(request.match_info["order_id"])
+        for order in self.orders:
+            if order["id"] == order_id:
+                order["order_state"] = 9
+                updated = self._timestamp()
+                order["states"].insert(0, {"state": 9, "timestamp": updated})
+                order["updated"] = updated
+                return web.json_response(order)
+        raise web.HTTPNotFound()
+
+    async def _menu_handler(self, request: web.Request) -> web.Response:
+        return self._json(request, self._menu(request.match_info["date"]))
+
+    def make_app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/v1/auth/login/", self._login, name="login")
+        app.router.add_get("/v1/user/orders", self._orders, name="orders")
+        app.router.add_patch("/v1/user/orders/{order_id}/cancel/", self._cancel, name="cancel")
+        app.router.add_get(
+            "/v1/venues/{venue}/menu/{menu_type}/{date}/", self._menu_handler, name="menu"
+        )
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+        self.base_url = f"http://{host}:{bound_port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def main() -> None:
+    """Run the fake server until interrupted."""
+    parser = argparse.ArgumentParser(description="Local stand-in for api.bessa.app")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--orders", type=int, default=10)
+    parser.add_argument("--menu-items", type=int, default=8)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="0..1 share of 500s")
+    args = parser.parse_args()
+
+    server = FakeBessaServer(
+        latency=args.latency,
+        page_size=args.page_size,
+        orders=args.orders,
+        menu_items=args.menu_items,
+        error_rate=args.error_rate,
+    )
+    web.run_app(server.make_app(), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,41 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import aiohttp_client
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_PARSE_IN_EXECUTOR,
+    CONF_PARSER_CACHE_SIZE,
+    CONF_TOKEN,
+    CONF_VALIDATION_MODE,
+    DATA_API_CLIENT,
+    DATA_MENUS_COORDINATOR,
+    DATA_ORDERS_COORDINATOR,
+    DATA_VENUES,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_PARSE_IN_EXECUTOR,
+    DEFAULT_VALIDATION_MODE,
+    DOMAIN,
+    PARSER_CACHE_SIZE,
+)
 from .bessa_api import BessaAPIClient
+from .coordinator import (
+    SNAPSHOT_MENUS,
+    SNAPSHOT_ORDERS,
+    BessaLunchMenusCoordinator,
+    BessaLunchOrdersCoordinator,
+    VenueMenus,
+    snapshot_store,
+    venue_key,
+)
+from .menu_parser import configure_parser_cache
+from .validation import ResponseValidator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,22 +48,98 @@ SERVICE_CANCEL_ORDER = "cancel_order"
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Bessa Lunch from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+    # The parser cache is shared by all accounts: use the largest size, so
+    # setting up one entry neither shrinks nor needlessly empties it
+    configure_parser_cache(
+        max(
+            other.options.get(CONF_PARSER_CACHE_SIZE, PARSER_CACHE_SIZE)
+            for other in hass.config_entries.async_entries(DOMAIN)
+        )
+    )
 
-    # Create API client
+    @callback
+    def _async_store_token(token: str) -> None:
+        """Persist a new auth token in the config entry."""
+        if entry.data.get(CONF_TOKEN) != token:
+            hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_TOKEN: token}
+            )
+    
+    # Menus are shared by all entries of a venue; orders stay per account
+    venue_id = entry.data["venue_id"]
+    venues: dict[int, VenueMenus] = hass.data[DOMAIN].setdefault(DATA_VENUES, {})
+    venue = venues.get(venue_id)
+    
+    # Create API client, reusing the stored token to skip the login request
     api_client = BessaAPIClient(
         username=entry.data["username"],
         password=entry.data["password"],
-        venue_id=entry.data["venue_id"],
+        venue_id=venue_id,
         session=aiohttp_client.async_get_clientsession(hass),
+        menu_cache=venue.menu_cache if venue is not None else None,
+        validator=ResponseValidator(
+            entry.options.get(CONF_VALIDATION_MODE, DEFAULT_VALIDATION_MODE)
+        ),
+        token=entry.data.get(CONF_TOKEN),
+        token_updated_callback=_async_store_token,
     )
     
-    # Create coordinator
-    coordinator = BessaLunchDataUpdateCoordinator(hass, api_client)
+    # Create coordinators; menus and orders refresh independently
+    coordinators = []
+    if venue is None:
+        venue = venues[venue_id] = VenueMenus(
+            BessaLunchMenusCoordinator(
+                hass,
+                venue_id,
+                api_client,
+                max_concurrent_requests=entry.options.get(
+                    CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+                ),
+                parse_in_executor=entry.options.get(
+                    CONF_PARSE_IN_EXECUTOR, DEFAULT_PARSE_IN_EXECUTOR
+                ),
+            )
+        )
+        coordinators.append(venue.coordinator)
+    venue.attach(entry.entry_id, api_client)
+    menus_coordinator = venue.coordinator
+    orders_coordinator = BessaLunchOrdersCoordinator(
+        hass, entry, api_client, menus_coordinator
+    )
+    coordinators.append(orders_coordinator)
     
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Start from the last persisted snapshot if there is one and refresh in
+    # the background; otherwise block setup on the first fetch as usual.
+    # Menus go first since the orders polling schedule depends on them.
+    try:
+        for coordinator in coordinators:
+            if await coordinator.async_restore_snapshot():
+                entry.async_create_background_task(
+                    hass,
+                    coordinator.async_refresh(),
+                    f"{coordinator.name}_initial_refresh",
+                )
+            elif coordinator is orders_coordinator:
+                await coordinator.async_config_entry_first_refresh()
+            else:
+                # The shared menus coordinator has no config entry of its own
+                await coordinator.async_refresh()
+                if not coordinator.last_update_success:
+                    raise ConfigEntryNotReady(
+                        f"Could not fetch menus: {coordinator.last_exception}"
+                    )
+    except Exception:
+        # Undo the venue registration so a retry starts from scratch and a
+        # deleted entry's client is not used for the venue's menus
+        if not venue.detach(entry.entry_id):
+            await venues.pop(venue_id).coordinator.async_shutdown()
+        raise
     
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = {
+        DATA_ORDERS_COORDINATOR: orders_coordinator,
+        DATA_MENUS_COORDINATOR: menus_coordinator,
+        DATA_API_CLIENT: api_client,
+    }
     
     # Register services
     async def handle_cancel_order(call: ServiceCall) -> None:
@@ -53,8 +154,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         
         if success:
             _LOGGER.info("Order %s cancelled successfully", order_id)
-            # Refresh the coordinator to get updated order data
-            await coordinator.async_refresh()
+            # Only the orders change on cancel; menus keep their own schedule
+            await orders_coordinator.async_refresh()
         else:
             _LOGGER.error("Failed to cancel order %s", order_id)
     
@@ -64,6 +165,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         handle_cancel_order
     )
     
+    # Reload to apply changed options; token updates also notify listeners
+    options = dict(entry.options)
+    
+    async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Reload the entry when its options changed."""
+        if dict(entry.options) != options:
+            await hass.config_entries.async_reload(entry.entry_id)
+    
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+    
     # Forward the setup to the sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
@@ -74,40 +185,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        
+        # Stop the shared menus once the last entry of the venue is gone
+        venue_id = entry.data["venue_id"]
+        venues: dict[int, VenueMenus] = hass.data[DOMAIN][DATA_VENUES]
+        if not venues[venue_id].detach(entry.entry_id):
+            await venues.pop(venue_id).coordinator.async_shutdown()
     
     return unload_ok
 
 
-class BessaLunchDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Bessa lunch data."""
-    
-    def __init__(self, hass: HomeAssistant, api_client: BessaAPIClient) -> None:
-        """Initialize."""
-        self.api_client = api_client
-        
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(minutes=30),
-        )
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshots when a config entry is deleted."""
+    await snapshot_store(hass, entry.entry_id, SNAPSHOT_ORDERS).async_remove()
     
-    async def _async_update_data(self):
-        """Fetch data from API."""
-        try:
-            # Fetch today's orders
-            orders_data = await self.api_client.get_today_orders()
-            
-            # Fetch menus for the next 7 days
-            from datetime import datetime, timedelta
-            result = orders_data.copy()
-            
-            for days_ahead in range(7):
-                target_date = (datetime.now().date() + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
-                menu_data = await self.api_client.get_menu(target_date)
-                # Extract the items array from the menu data
-                result[f"menu_{target_date}"] = menu_data.get("items", [])
-            
-            return result
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+    venue_id = entry.data["venue_id"]
+    if not any(
+        other.entry_id != entry.entry_id and other.data.get("venue_id") == venue_id
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        await snapshot_store(hass, venue_key(venue_id), SNAPSHOT_MENUS).async_remove()
@@ -1,22 +1,112 @@
 """Bessa API client."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar
 
 import aiohttp
 
-from .const import BESSA_BASE_URL, BESSA_LOGIN_URL, BESSA_ORDERS_URL, MENU_TYPE
+try:
+    # Optional faster decoder; Home Assistant installs it, plain setups may not
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from .const import (
+    BESSA_BASE_URL,
+    BESSA_LOGIN_PATH,
+    BESSA_ORDERS_PATH,
+    MENU_CACHE_NEAR_DAYS,
+    MENU_CACHE_TTL_FAR,
+    MENU_CACHE_TTL_NEAR,
+    MENU_CACHE_TTL_TODAY,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    MENU_TYPE,
+    ORDERS_FULL_SYNC_INTERVAL,
+    REQUEST_BACKOFF_BASE,
+    REQUEST_BACKOFF_MAX,
+    REQUEST_RETRY_ATTEMPTS,
+    REQUEST_TIMEOUT_CANCEL,
+    REQUEST_TIMEOUT_LOGIN,
+    REQUEST_TIMEOUT_MENU,
+    REQUEST_TIMEOUT_ORDERS,
+    TOKEN_REFRESH_AGE,
+)
+from .menu_cache import MenuCache
+from .models import MenuItem, Order
+from .resilience import (
+    RETRY_STATUSES,
+    CircuitBreaker,
+    CircuitOpenError,
+    TransientError,
+    with_retries,
+)
+from .validation import ResponseValidator, SchemaValidationError
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class AuthenticationError(Exception):
     """Exception raised for authentication errors."""
     pass
 
 
+class BessaAPIError(Exception):
+    """Exception raised for unexpected API responses."""
+    pass
+
+
+def _conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from stored validators."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _project_menu_items(categories: list[dict[str, Any]]) -> tuple[MenuItem, ...]:
+    """Extract the menu items the sensors use from the categories of a menu response."""
+    return tuple(
+        MenuItem.from_api(item, category.get("name", ""))
+        for category in categories
+        for item in category.get("items", [])
+    )
+
+
+class _Response:
+    """Status, headers and body of a completed request."""
+    
+    __slots__ = ("status", "headers", "body")
+    
+    def __init__(self, status: int, headers: Any, body: bytes) -> None:
+        """Initialize the response."""
+        self.status = status
+        self.headers = headers
+        self.body = body
+    
+    def json(self) -> Any:
+        """Decode the body as JSON."""
+        return json_loads(self.body) if self.body else {}
+    
+    def text(self) -> str:
+        """Decode the body as text."""
+        return self.body.decode("utf-8", errors="replace")
+
+
+def _response_validators(response: _Response) -> tuple[str | None, str | None]:
+    """Return the (ETag, Last-Modified) headers of a response."""
+    return response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+
 class BessaAPIClient:
     """API client for Bessa lunch orders."""
     
@@ -26,13 +116,57 @@ class BessaAPIClient:
         password: str,
         venue_id: int,
         session: aiohttp.ClientSession,
+        menu_cache: MenuCache | None = None,
+        validator: ResponseValidator | None = None,
+        token: str | None = None,
+        token_updated_callback: Callable[[str], None] | None = None,
+        base_url: str = BESSA_BASE_URL,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+        
+        A previously stored token can be passed in to skip the login request;
+        it is used until the API rejects it with a 401 or it gets older than
+        TOKEN_REFRESH_AGE. The callback is invoked with every new token so the
+        caller can persist it. base_url can point the client at another
+        server, e.g. the local stand-in used by the benchmarks. validator
+        checks responses against the API schema; by default nothing is
+        validated.
+        """
         self.username = username
         self.password = password
         self.venue_id = venue_id
         self.session = session
-        self._token: str | None = None
+        self.base_url = base_url.rstrip("/")
+        self._token: str | None = token
+        # A stored token's real age is unknown; count it from startup
+        self._token_obtained_at: float | None = time.monotonic() if token else None
+        # Authorization headers, rebuilt only when the token changes
+        self._auth_headers: dict[str, str] = {}
+        self._auth_headers_token: str | None = None
+        self._token_updated_callback = token_updated_callback
+        # Serializes logins so concurrent 401s trigger a single re-login
+        self._auth_lock = asyncio.Lock()
+        # Identical GETs currently in flight, shared by concurrent callers
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # Shared by all endpoints: an outage seen by one request pauses all
+        self.circuit_breaker = CircuitBreaker(
+            CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+        )
+        # Local order index for incremental sync, keyed by order id
+        self._orders_index: dict[int, Order] = {}
+        self._orders_updated_since: str | None = None
+        self._last_full_order_sync: float | None = None
+        # Orders restored from storage, served until the first sync succeeds
+        self._orders_restored = False
+        # (query, ETag, Last-Modified) of the last first-page orders response
+        self._orders_validators: tuple[tuple, str | None, str | None] | None = None
+        self.validator = validator or ResponseValidator()
+        self.menu_cache = menu_cache or MenuCache(
+            today_ttl=MENU_CACHE_TTL_TODAY,
+            near_ttl=MENU_CACHE_TTL_NEAR,
+            far_ttl=MENU_CACHE_TTL_FAR,
+            near_days=MENU_CACHE_NEAR_DAYS,
+        )
     
     async def authenticate(self) -> bool:
         """Authenticate with Bessa API."""
@@ -43,8 +177,10 @@ class BessaAPIClient:
             _LOGGER.debug("Attempting authentication with email: '%s'", email)
             
             # Login uses email field (not username) and returns sessionid cookie
-            async with self.session.post(
-                BESSA_LOGIN_URL,
+            response = await self._send(
+                "POST",
+                f"{self.base_url}{BESSA_LOGIN_PATH}",
+                REQUEST_TIMEOUT_LOGIN,
                 json={
                     "email": email,
                     "password": self.password,
@@ -53,108 +189,443 @@ class BessaAPIClient:
                     "Content-Type": "application/json",
                     "Accept": "application/json",
                 },
-            ) as response:
-                if response.status == 200 or response.status == 201:
-                    data = await response.json()
-                    _LOGGER.debug("Login successful: %s", data)
-                    
-                    # Token is in 'key' field, use with "Token" prefix
-                    self._token = data.get("key")
-                    
-                    if self._token:
-                        _LOGGER.debug("Authentication token received")
-                        return True
-                    else:
-                        _LOGGER.error("No token in response")
-                        return False
-                elif response.status == 400:
-                    # Handle validation errors from official API spec
-                    error_data = await response.json()
-                    error_msg = "Login failed: "
-                    if "non_field_errors" in error_data:
-                        error_msg += ", ".join(error_data["non_field_errors"])
-                    elif "email" in error_data:
-                        error_msg += ", ".join(error_data["email"])
-                    elif "password" in error_data:
-                        error_msg += ", ".join(error_data["password"])
-                    else:
-                        error_msg += str(error_data)
-                    _LOGGER.error(error_msg)
-                    return False
+            )
+            if response.status == 200 or response.status == 201:
+                data = self._decode(response, "login")
+                _LOGGER.debug("Login successful: %s", data)
+                
+                # Token is in 'key' field, use with "Token" prefix
+                self._token = data.get("key")
+                
+                if self._token:
+                    _LOGGER.debug("Authentication token received")
+                    self._token_obtained_at = time.monotonic()
+                    if self._token_updated_callback is not None:
+                        self._token_updated_callback(self._token)
+                    return True
                 else:
-                    _LOGGER.error("Authentication failed with status %s", response.status)
-                    response_text = await response.text()
-                    _LOGGER.error("Response: %s", response_text)
+                    _LOGGER.error("No token in response")
                     return False
+            elif response.status == 400:
+                # Handle validation errors from official API spec
+                error_data = response.json()
+                error_msg = "Login failed: "
+                if "non_field_errors" in error_data:
+                    error_msg += ", ".join(error_data["non_field_errors"])
+                elif "email" in error_data:
+                    error_msg += ", ".join(error_data["email"])
+                elif "password" in error_data:
+                    error_msg += ", ".join(error_data["password"])
+                else:
+                    error_msg += str(error_data)
+                _LOGGER.error(error_msg)
+                return False
+            else:
+                _LOGGER.error("Authentication failed with status %s", response.status)
+                response_text = response.text()
+                _LOGGER.error("Response: %s", response_text)
+                return False
+        except (TransientError, CircuitOpenError, SchemaValidationError):
+            # Let callers tell an unreachable API or an unexpected response
+            # (strict validation) from bad credentials
+            raise
         except Exception as err:
             _LOGGER.error("Authentication error: %s", err)
             return False
-    
-    async def get_today_orders(self) -> dict[str, Any]:
-        """Get recent lunch orders with optimized API query.
+
+    @property
+    def token(self) -> str | None:
+        """Return the current authentication token."""
+        return self._token
+
+    def _token_is_fresh(self) -> bool:
+        """Return True if a token is available and younger than TOKEN_REFRESH_AGE."""
+        return bool(self._token) and (
+            self._token_obtained_at is None
+            or time.monotonic() - self._token_obtained_at
+            < TOKEN_REFRESH_AGE.total_seconds()
+        )
+
+    async def ensure_authenticated(self) -> None:
+        """Log in if no token is available yet or the current one is old.
+
+        Call this before issuing several requests concurrently so they
+        share one login instead of each triggering their own.
+        """
+        if self._token_is_fresh():
+            return
+        async with self._auth_lock:
+            # Another caller may have logged in while we waited for the lock
+            if self._token_is_fresh():
+                return
+            old_token = self._token
+            if await self.authenticate():
+                return
+            if old_token is None:
+                raise AuthenticationError("Authentication failed")
+            # Proactive renewal failed; keep the old token until it is rejected
+            _LOGGER.debug("Token renewal failed, keeping the current token")
+            self._token = old_token
+            self._token_obtained_at = time.monotonic()
+
+    async def _reauthenticate(self, rejected_token: str | None) -> None:
+        """Replace a token the API rejected with a 401.
         
-        Returns orders from the last 7 days for our venue,
-        filtered and sorted server-side for efficiency.
+        Requests rejected concurrently all end up here; the first one logs
+        in again and the others reuse the token it obtained.
         """
-        # Ensure we're authenticated
-        if not self._token:
+        async with self._auth_lock:
+            if self._token and self._token != rejected_token:
+                return
+            self._token = None
             if not await self.authenticate():
-                raise AuthenticationError("Authentication failed")
+                raise AuthenticationError("Re-authentication failed")
+
+    async def _single_flight(
+        self,
+        key: tuple,
+        request: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Run a request once for all concurrent callers with the same key.
         
-        try:
-            # Optimized query with server-side filtering
-            start_date = datetime.now() - timedelta(days=7)
-            
+        Callers arriving while the request is in flight await its result
+        instead of sending an identical request of their own.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(request())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # One caller being cancelled must not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _headers(self, extra: dict[str, str] | None = None) -> dict[str, str]:
+        """Return the headers of an authenticated request."""
+        if self._auth_headers_token != self._token:
             # Bessa API uses "Token" prefix (not "Bearer")
-            headers = {
+            self._auth_headers = {
                 "Authorization": f"Token {self._token}",
                 "Accept": "application/json",
             }
+            self._auth_headers_token = self._token
+        return {**self._auth_headers, **extra} if extra else self._auth_headers
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        attempts: int = REQUEST_RETRY_ATTEMPTS,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> _Response:
+        """Send an authenticated request to the Bessa API.
+
+        Logs in first when needed. A 401 triggers one re-login and one more
+        attempt; if that is rejected as well AuthenticationError is raised
+        instead of trying again.
+        """
+        await self.ensure_authenticated()
+        token = self._token
+        response = await self._send(
+            method, url, timeout, attempts, headers=self._headers(headers), **kwargs
+        )
+        if response.status != 401:
+            return response
+        
+        _LOGGER.debug("Token rejected, logging in again")
+        await self._reauthenticate(token)
+        response = await self._send(
+            method, url, timeout, attempts, headers=self._headers(headers), **kwargs
+        )
+        if response.status == 401:
+            raise AuthenticationError(f"{method} {url} rejected after logging in again")
+        return response
+
+    def _decode(self, response: _Response, kind: str) -> Any:
+        """Decode a JSON response and pass it through the schema validator."""
+        data = response.json()
+        self.validator.validate(kind, data)
+        return data
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        attempts: int = REQUEST_RETRY_ATTEMPTS,
+        **kwargs: Any,
+    ) -> _Response:
+        """Send a request through the retry and circuit breaker layer.
+
+        Timeouts, connection errors and 429/5xx responses are retried with
+        jittered backoff; after the last attempt they raise TransientError.
+        While the circuit breaker is open CircuitOpenError is raised without
+        sending anything. Any other response is returned as is.
+        """
+        async def _attempt() -> _Response:
+            try:
+                async with self.session.request(
+                    method,
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    **kwargs,
+                ) as response:
+                    body = await response.read()
+            except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+                raise TransientError(f"{method} {url} failed: {err!r}") from err
+            if response.status in RETRY_STATUSES:
+                raise TransientError(f"{method} {url} returned {response.status}")
+            return _Response(response.status, response.headers, body)
+
+        return await with_retries(
+            _attempt,
+            self.circuit_breaker,
+            attempts,
+            REQUEST_BACKOFF_BASE,
+            REQUEST_BACKOFF_MAX,
+        )
+
+    async def get_today_orders(self, incremental: bool = True) -> dict[str, Any]:
+        """Get recent lunch orders with optimized API query.
+        
+        Returns Order models from the last 7 days for our venue,
+        filtered and sorted server-side for efficiency.
+        
+        Orders are kept in a local index keyed by order id. In incremental
+        mode only orders updated since the newest "updated" timestamp seen so
+        far are requested and merged into the index; a full sync happens on
+        the first call and then every ORDERS_FULL_SYNC_INTERVAL. Concurrent
+        calls share one request.
+        """
+        return await self._single_flight(
+            ("orders", incremental), lambda: self._fetch_today_orders(incremental)
+        )
+    
+    async def _fetch_today_orders(self, incremental: bool) -> dict[str, Any]:
+        """Fetch recent orders and merge them into the local index."""
+        try:
+            # Optimized query with server-side filtering. Day granularity keeps
+            # the query stable between polls so conditional requests can match.
+            start_date = datetime.combine(
+                datetime.now().date() - timedelta(days=7), datetime.min.time()
+            )
+            full_sync = (
+                not incremental
+                or self._orders_updated_since is None
+                or self._last_full_order_sync is None
+                or time.monotonic() - self._last_full_order_sync
+                >= ORDERS_FULL_SYNC_INTERVAL.total_seconds()
+            )
             
             # Add query parameters for efficient filtering
             params = {
                 "venue": self.venue_id,  # Filter by configured venue
-                "deleted__isnull": "true",  # Exclude deleted orders
                 "date__gte": start_date.isoformat(),  # Orders from last 7 days
                 "ordering": "-date",  # Newest first
             }
+            if full_sync:
+                params["deleted__isnull"] = "true"  # Exclude deleted orders
+            else:
+                # Deleted orders must come through so they can be dropped
+                params["updated__gte"] = self._orders_updated_since
             
-            async with self.session.get(
-                BESSA_ORDERS_URL,
-                headers=headers,
-                params=params,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    # API returns paginated response with "results" array
-                    all_orders = data.get("results", [])
-                    
-                    # Handle pagination if needed (fetch all pages)
-                    next_url = data.get("next")
-                    while next_url:
-                        async with self.session.get(
-                            next_url,
-                            headers=headers,
-                        ) as next_response:
-                            if next_response.status == 200:
-                                next_data = await next_response.json()
-                                all_orders.extend(next_data.get("results", []))
-                                next_url = next_data.get("next")
-                            else:
-                                break
-                    
-                    return {"orders": all_orders}
-                elif response.status == 401:
-                    # Token expired, re-authenticate
-                    self._token = None
-                    return await self.get_today_orders()
-                else:
-                    _LOGGER.error("Failed to fetch orders: %s", response.status)
-                    return {"orders": []}
+            # Validators only apply to the exact same single-page query. A full
+            # sync never sends them: it exists to catch what they could hide.
+            headers = None
+            request_key = tuple(sorted((k, str(v)) for k, v in params.items()))
+            if (
+                not full_sync
+                and self._orders_validators
+                and self._orders_validators[0] == request_key
+            ):
+                headers = _conditional_headers(*self._orders_validators[1:])
+            
+            try:
+                response = await self._request(
+                    "GET",
+                    f"{self.base_url}{BESSA_ORDERS_PATH}",
+                    REQUEST_TIMEOUT_ORDERS,
+                    headers=headers,
+                    params=params,
+                )
+            except (TransientError, CircuitOpenError) as err:
+                # Serve the orders we already know instead of failing
+                if self._last_full_order_sync is None and not self._orders_restored:
+                    raise
+                _LOGGER.warning("Bessa API unavailable, using cached orders: %s", err)
+                return {"orders": self._indexed_orders()}
+            
+            if response.status == 304:
+                _LOGGER.debug("Orders not modified")
+                return {"orders": self._indexed_orders()}
+            elif response.status == 200:
+                validators = _response_validators(response)
+                data = self._decode(response, "orders")
+            else:
+                _LOGGER.error("Failed to fetch orders: %s", response.status)
+                return {"orders": self._indexed_orders()}
+            
+            # Merge the following pages into the index while they stream in
+            single_page = not data.get("next")
+            complete = await self._sync_orders(data, full_sync, start_date)
+            # The validators only describe the first page, so a 304 could hide
+            # changes on later pages or pages that failed to arrive
+            self._orders_validators = (
+                (request_key, *validators) if complete and single_page else None
+            )
+            return {"orders": self._indexed_orders()}
         except Exception as err:
             _LOGGER.error("Error fetching orders: %s", err)
             raise
     
+    async def iter_orders(
+        self,
+        start_date: datetime,
+        **filters: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the venue's orders from start_date on, newest first.
+        
+        Orders are yielded page by page without collecting all pages in
+        memory; the next page is requested while the current one is being
+        consumed. Extra keyword arguments are passed as query filters.
+        """
+        params = {
+            "venue": self.venue_id,
+            "deleted__isnull": "true",
+            "date__gte": start_date.isoformat(),
+            "ordering": "-date",
+            **filters,
+        }
+        first_page = await self._fetch_order_page(
+            f"{self.base_url}{BESSA_ORDERS_PATH}", params
+        )
+        async for order in self._iter_order_pages(first_page, start_date):
+            yield order
+    
+    async def _fetch_order_page(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch one page of orders, raising on anything but a 200."""
+        response = await self._request("GET", url, REQUEST_TIMEOUT_ORDERS, params=params)
+        if response.status != 200:
+            raise BessaAPIError(f"Orders page returned status {response.status}")
+        return self._decode(response, "orders")
+    
+    async def _iter_order_pages(
+        self,
+        first_page: dict[str, Any],
+        start_date: datetime,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the orders of a first page and all pages following it.
+        
+        The next page is prefetched while the current one is consumed, and
+        iteration stops early once orders fall before start_date since
+        results are ordered newest first.
+        """
+        cutoff = start_date.strftime("%Y-%m-%d")
+        page: dict[str, Any] | None = first_page
+        prefetch: asyncio.Task | None = None
+        try:
+            while page is not None:
+                next_url = page.get("next")
+                prefetch = (
+                    asyncio.create_task(self._fetch_order_page(next_url))
+                    if next_url
+                    else None
+                )
+                for order in page.get("results", []):
+                    order_date = (order.get("date") or "")[:10]
+                    if order_date and order_date < cutoff:
+                        return
+                    yield order
+                page = await prefetch if prefetch is not None else None
+                prefetch = None
+        finally:
+            # Stopped early or failed: do not leave the prefetch running, and
+            # mark a failure nobody will await as retrieved so asyncio does
+            # not log it
+            if prefetch is not None:
+                if not prefetch.done():
+                    prefetch.cancel()
+                elif not prefetch.cancelled():
+                    prefetch.exception()
+    
+    async def _sync_orders(
+        self,
+        first_page: dict[str, Any],
+        full_sync: bool,
+        start_date: datetime,
+    ) -> bool:
+        """Merge streamed orders into the local order index.
+        
+        Returns True when every page arrived.
+        """
+        # A full sync rebuilds the index and only replaces it when complete
+        index = {} if full_sync else self._orders_index
+        newest = self._orders_updated_since
+        complete = True
+        try:
+            async for order in self._iter_order_pages(first_page, start_date):
+                order_id = order.get("id")
+                if order_id is None:
+                    continue
+                if order.get("deleted"):
+                    index.pop(order_id, None)
+                else:
+                    index[order_id] = Order.from_api(order)
+                # ISO timestamps from the API share one format, so they sort as strings
+                updated = order.get("updated")
+                if updated and (newest is None or updated > newest):
+                    newest = updated
+        except (BessaAPIError, TransientError, CircuitOpenError) as err:
+            _LOGGER.warning("Order sync incomplete: %s", err)
+            complete = False
+        
+        if full_sync:
+            if complete:
+                self._orders_index = index
+            else:
+                self._orders_index.update(index)
+        
+        # Only advance the watermark when every page arrived, otherwise
+        # changes on the missing pages would never be requested again
+        if complete:
+            self._orders_updated_since = newest
+            if full_sync:
+                self._last_full_order_sync = time.monotonic()
+        
+        # Drop orders that fell out of the 7 day window
+        cutoff = start_date.strftime("%Y-%m-%d")
+        for order_id in [
+            order_id
+            for order_id, order in self._orders_index.items()
+            if order.date < cutoff
+        ]:
+            del self._orders_index[order_id]
+        
+        return complete
+    
+    def restore_orders(self, orders: list[Order]) -> None:
+        """Seed the order index with orders persisted before a restart.
+        
+        They are only served while the API is unreachable: the first sync is
+        still a full one and replaces them.
+        """
+        if self._last_full_order_sync is None and not self._orders_index:
+            self._orders_index = {order.id: order for order in orders}
+            self._orders_restored = True
+    
+    def _indexed_orders(self) -> list[Order]:
+        """Return the indexed orders, newest first."""
+        return sorted(
+            self._orders_index.values(),
+            key=lambda order: (order.date, order.pickup_time or ""),
+            reverse=True,
+        )
+    
     def _is_cancelled(self, order: dict) -> bool:
         """Check if an order is cancelled."""
         # State 9 means cancelled
@@ -177,137 +648,133 @@ class BessaAPIClient:
     
     async def get_order_for_date(self, date: str) -> dict[str, Any]:
         """Get lunch orders for a specific date."""
-        if not self._token:
-            if not await self.authenticate():
-                raise AuthenticationError("Authentication failed")
-        
         try:
-            headers = {
-                "Authorization": f"Token {self._token}",
-                "Accept": "application/json",
-            }
-            
-            async with self.session.get(
-                BESSA_ORDERS_URL,
-                headers=headers,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    all_orders = data.get("results", [])
-                    date_orders = [
-                        order for order in all_orders
-                        if self._is_order_for_date(order, date)
-                    ]
-                    return {"orders": date_orders}
-                else:
-                    _LOGGER.error("Failed to fetch orders for %s: %s", date, response.status)
-                    return {}
+            response = await self._request(
+                "GET",
+                f"{self.base_url}{BESSA_ORDERS_PATH}",
+                REQUEST_TIMEOUT_ORDERS,
+            )
+            if response.status == 200:
+                data = self._decode(response, "orders")
+                all_orders = data.get("results", [])
+                date_orders = [
+                    order for order in all_orders
+                    if self._is_order_for_date(order, date)
+                ]
+                return {"orders": date_orders}
+            else:
+                _LOGGER.error("Failed to fetch orders for %s: %s", date, response.status)
+                return {}
         except Exception as err:
             _LOGGER.error("Error fetching orders for %s: %s", date, err)
             raise
     
-    async def get_menu(self, date: str) -> dict[str, Any]:
+    async def get_menu(self, date: str, include_raw: bool = False) -> dict[str, Any]:
         """Get menu for a specific date.
         
-        Returns menu data including categories, items, and availability counts.
-        """
-        # Ensure we're authenticated
-        if not self._token:
-            if not await self.authenticate():
-                raise AuthenticationError("Authentication failed")
+        Returns {"items": (MenuItem, ...)} including availability counts.
+        Results are served from the per-date menu cache while still fresh;
+        concurrent calls for the same date share one request.
         
+        With include_raw the menu is fetched bypassing the cache and the
+        response's "categories" and full "raw_data" are returned as well,
+        e.g. for diagnostics. They are never cached.
+        """
+        if include_raw:
+            return await self._fetch_menu(date, include_raw=True)
+        cached = self.menu_cache.get(date)
+        if cached is not None:
+            return cached
+        return await self._single_flight(("menu", date), lambda: self._fetch_menu(date))
+    
+    async def _fetch_menu(self, date: str, include_raw: bool = False) -> dict[str, Any]:
+        """Fetch the menu for a date from the API and cache it."""
         try:
             # Bessa API endpoint for menu
             # menu_type 7 = canteen menu
-            url = f"{BESSA_BASE_URL}/v1/venues/{self.venue_id}/menu/{MENU_TYPE}/{date}/"
-            
-            headers = {
-                "Authorization": f"Token {self._token}",
-                "Accept": "application/json",
-            }
+            url = f"{self.base_url}/v1/venues/{self.venue_id}/menu/{MENU_TYPE}/{date}/"
             
-            async with self.session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    results = data.get("results", [])
-                    
-                    # Process menu data to extract items with availability
-                    menu_items = []
-                    for category in results:
-                        items = category.get("items", [])
-                        for item in items:
-                            # Extract availability (use available_amount, not available)
-                            available_amount = item.get("available_amount")
-                            available = None
-                            if available_amount:
-                                try:
-                                    available = int(available_amount)
-                                except (ValueError, TypeError):
-                                    available = None
-                            
-                            menu_items.append({
-                                "id": item.get("id"),
-                                "name": item.get("name", "Unknown"),
-                                "description": item.get("description", ""),
-                                "price": item.get("price", "0"),
-                                "allergens": item.get("allergens", ""),
-                                "available": available,  # Now correctly extracted
-                                "category": category.get("name", ""),
-                            })
-                    
-                    return {
-                        "categories": results,
-                        "items": menu_items,
-                        "raw_data": data,
-                    }
-                elif response.status == 401:
-                    # Token expired, re-authenticate
-                    self._token = None
-                    return await self.get_menu(date)
-                else:
-                    _LOGGER.debug("No menu available for %s: %s", date, response.status)
-                    return {"categories": [], "items": []}
-        except Exception as err:
-            _LOGGER.error("Error fetching menu for %s: %s", date, err)
-            return {"categories": [], "items": []}
+            response = await self._request(
+                "GET",
+                url,
+                REQUEST_TIMEOUT_MENU,
+                headers=(
+                    None
+                    if include_raw
+                    else _conditional_headers(*self.menu_cache.validators(date))
+                ),
+            )
+            if response.status == 304:
+                # Unchanged since the cached copy; reuse the parsed result
+                menu = self.menu_cache.revalidate(date)
+                if menu is not None:
+                    _LOGGER.debug("Menu for %s not modified", date)
+                    return menu
+                return {"items": ()}
+            elif response.status == 200:
+                data = self._decode(response, "menu")
+                results = data.get("results", [])
+                menu = {"items": _project_menu_items(results)}
+                if include_raw:
+                    return {**menu, "categories": results, "raw_data": data}
+                self._cache_menu(date, menu, *_response_validators(response))
+                return menu
+            else:
+                _LOGGER.debug("No menu available for %s: %s", date, response.status)
+                menu = {"items": ()}
+                if response.status == 404 and not include_raw:
+                    # No menu published for this date; cache like a real menu
+                    self._cache_menu(date, menu)
+                return menu
+        except (TransientError, CircuitOpenError) as err:
+            # Serve an expired copy rather than pretending there is no menu
+            stale = None if include_raw else self.menu_cache.get_stale(date)
+            if stale is None:
+                raise
+            _LOGGER.warning("Bessa API unavailable, using cached menu for %s: %s", date, err)
+            return stale
+    
+    def _cache_menu(
+        self,
+        date: str,
+        menu: dict[str, Any],
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a menu in the cache and drop dates that fell out of the window."""
+        self.menu_cache.set(date, menu, etag, last_modified)
+        self.menu_cache.prune(keep_days=1)
     
     async def cancel_order(self, order_id: int) -> bool:
         """Cancel an order by ID.
         
         Returns True if successful, False otherwise.
         """
-        # Ensure we're authenticated
-        if not self._token:
-            if not await self.authenticate():
-                raise AuthenticationError("Authentication failed")
-        
         try:
             # Cancel order endpoint
-            url = f"{BESSA_BASE_URL}/v1/user/orders/{order_id}/cancel/"
+            url = f"{self.base_url}{BESSA_ORDERS_PATH}/{order_id}/cancel/"
             
-            headers = {
-                "Authorization": f"Token {self._token}",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-            
-            async with self.session.patch(url, headers=headers, json={}) as response:
-                if response.status == 200:
-                    _LOGGER.debug("Order %s cancelled successfully", order_id)
-                    return True
-                elif response.status == 401:
-                    # Token expired, re-authenticate and retry
-                    self._token = None
-                    return await self.cancel_order(order_id)
-                else:
-                    error_data = await response.text()
-                    _LOGGER.error(
-                        "Failed to cancel order %s: status %s, response: %s",
-                        order_id,
-                        response.status,
-                        error_data,
-                    )
-                    return False
+            # Not retried: a cancel that reached the server must not be repeated
+            response = await self._request(
+                "PATCH",
+                url,
+                REQUEST_TIMEOUT_CANCEL,
+                attempts=1,
+                headers={"Content-Type": "application/json"},
+                json={},
+            )
+            if response.status == 200:
+                _LOGGER.debug("Order %s cancelled successfully", order_id)
+                return True
+            else:
+                error_data = response.text()
+                _LOGGER.error(
+                    "Failed to cancel order %s: status %s, response: %s",
+                    order_id,
+                    response.status,
+                    error_data,
+                )
+                return False
         except Exception as err:
             _LOGGER.error("Error cancelling order %s: %s", order_id, err)
             return False
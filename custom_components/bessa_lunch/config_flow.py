@@ -8,11 +8,29 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .bessa_api import BessaAPIClient
-from .const import CONF_VENUE_ID, DOMAIN
+from .const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_PARSE_IN_EXECUTOR,
+    CONF_PARSER_CACHE_SIZE,
+    CONF_TOKEN,
+    CONF_VALIDATION_MODE,
+    CONF_VENUE_ID,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_PARSE_IN_EXECUTOR,
+    DEFAULT_VALIDATION_MODE,
+    DOMAIN,
+    MENU_DAYS,
+    PARSER_CACHE_SIZE,
+    VALIDATION_OFF,
+    VALIDATION_SAMPLED,
+    VALIDATION_STRICT,
+)
+from .resilience import CircuitOpenError, TransientError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +48,14 @@ class BessaLunchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     
     VERSION = 1
     
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> BessaLunchOptionsFlow:
+        """Return the options flow."""
+        return BessaLunchOptionsFlow(config_entry)
+    
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -52,12 +78,15 @@ class BessaLunchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     await self.async_set_unique_id(user_input[CONF_USERNAME])
                     self._abort_if_unique_id_configured()
                     
+                    # Store the token so setup does not need to log in again
                     return self.async_create_entry(
                         title=f"Bessa Lunch ({user_input[CONF_USERNAME]})",
-                        data=user_input,
+                        data={**user_input, CONF_TOKEN: api_client.token},
                     )
                 else:
                     errors["base"] = "invalid_auth"
+            except (TransientError, CircuitOpenError):
+                errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
@@ -67,3 +96,45 @@ class BessaLunchConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class BessaLunchOptionsFlow(config_entries.OptionsFlow):
+    """Handle Bessa Lunch options."""
+    
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+    
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+        
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=options.get(
+                            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MENU_DAYS)),
+                    vol.Required(
+                        CONF_PARSE_IN_EXECUTOR,
+                        default=options.get(CONF_PARSE_IN_EXECUTOR, DEFAULT_PARSE_IN_EXECUTOR),
+                    ): bool,
+                    vol.Required(
+                        CONF_PARSER_CACHE_SIZE,
+                        default=options.get(CONF_PARSER_CACHE_SIZE, PARSER_CACHE_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10000)),
+                    vol.Required(
+                        CONF_VALIDATION_MODE,
+                        default=options.get(CONF_VALIDATION_MODE, DEFAULT_VALIDATION_MODE),
+                    ): vol.In([VALIDATION_OFF, VALIDATION_SAMPLED, VALIDATION_STRICT]),
+                }
+            ),
+        )
@@ -1,18 +1,82 @@
 """Constants for the Bessa Lunch integration."""
+from datetime import timedelta
 
 DOMAIN = "bessa_lunch"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_VENUE_ID = "venue_id"
+CONF_TOKEN = "token"  # Last known auth token, reused across restarts
+TOKEN_REFRESH_AGE = timedelta(hours=24)  # Renew the token before it gets this old
 
 # Bessa API URLs
 BESSA_BASE_URL = "https://api.bessa.app"
-BESSA_LOGIN_URL = f"{BESSA_BASE_URL}/v1/auth/login/"
-BESSA_ORDERS_URL = f"{BESSA_BASE_URL}/v1/user/orders"
+BESSA_LOGIN_PATH = "/v1/auth/login/"
+BESSA_ORDERS_PATH = "/v1/user/orders"
 
 # Bessa API configuration
 MENU_TYPE = 7   # Canteen menu type
 
+# Coordinator configuration
+DATA_ORDERS_COORDINATOR = "orders_coordinator"
+DATA_MENUS_COORDINATOR = "menus_coordinator"
+DATA_API_CLIENT = "api_client"
+DATA_VENUES = "venues"  # venue_id -> menus shared by all entries of the venue
+MENU_DAYS = 7  # Today plus 6 days ahead
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4  # Parallel requests to api.bessa.app per refresh
+
+# Adaptive polling: fast around pickup of today's orders, default during
+# active hours of days with a menu, and otherwise sleep until the next one
+POLL_INTERVAL_PICKUP = timedelta(minutes=2)
+POLL_INTERVAL_DEFAULT = timedelta(minutes=30)
+POLL_INTERVAL_MAX = timedelta(hours=12)
+PICKUP_WINDOW_BEFORE = timedelta(minutes=60)
+PICKUP_WINDOW_AFTER = timedelta(minutes=90)
+ACTIVE_HOURS_START = 6  # Local hour
+ACTIVE_HOURS_END = 20  # Local hour
+
+# Menu cache TTLs: today's availability changes quickly, later days rarely.
+# Menus for past dates are never refetched.
+MENU_CACHE_TTL_TODAY = timedelta(minutes=15)
+MENU_CACHE_TTL_NEAR = timedelta(hours=2)
+MENU_CACHE_TTL_FAR = timedelta(hours=6)
+MENU_CACHE_NEAR_DAYS = 2  # Tomorrow and the day after use the "near" TTL
+
+# Incremental order sync: periodically do a full sync to catch anything the
+# "updated since" filter could have missed
+ORDERS_FULL_SYNC_INTERVAL = timedelta(hours=6)
+
+# Request resilience: retries with jittered exponential backoff, per
+# endpoint timeouts (seconds) and a circuit breaker for outages
+REQUEST_RETRY_ATTEMPTS = 3  # Attempts in total, i.e. up to 2 retries
+REQUEST_BACKOFF_BASE = 1.0  # Seconds
+REQUEST_BACKOFF_MAX = 10.0  # Seconds
+REQUEST_TIMEOUT_LOGIN = 15
+REQUEST_TIMEOUT_ORDERS = 20
+REQUEST_TIMEOUT_MENU = 10
+REQUEST_TIMEOUT_CANCEL = 15
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive requests failing after all retries
+CIRCUIT_RESET_TIMEOUT = timedelta(minutes=5)
+
+# Response schema validation against the pydantic models in types.py
+CONF_VALIDATION_MODE = "validation_mode"
+VALIDATION_OFF = "off"
+VALIDATION_SAMPLED = "sampled"  # Validate 1 in VALIDATION_SAMPLE_RATE responses
+VALIDATION_STRICT = "strict"  # Validate every response, raise on mismatch
+DEFAULT_VALIDATION_MODE = VALIDATION_OFF  # Models not yet checked against every real payload
+VALIDATION_SAMPLE_RATE = 20
+
+# Menu description parser LRU cache (number of distinct descriptions)
+CONF_PARSER_CACHE_SIZE = "parser_cache_size"
+PARSER_CACHE_SIZE = 512
+# Parse the menus of all days in a worker thread instead of on the event loop
+CONF_PARSE_IN_EXECUTOR = "parse_in_executor"
+DEFAULT_PARSE_IN_EXECUTOR = False
+
+# Persisted coordinator snapshot used for instant startup
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10  # Seconds; coalesces writes from quick successive refreshes
+
 # Device info constants
 DEVICE_NAME = "Bessa Lunch"
 DEVICE_MANUFACTURER = "Bessa"
@@ -35,3 +99,5 @@ ORDER_STATES = {
     13: "Pre-ordered"
 }
 
+# Order states after which an order no longer changes
+FINAL_ORDER_STATES = {8, 9, 10, 11, 12}
@@ -0,0 +1,361 @@
+"""Data update coordinators for the Bessa Lunch integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry, current_entry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .bessa_api import BessaAPIClient
+from .const import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_PARSE_IN_EXECUTOR,
+    DOMAIN,
+    MENU_DAYS,
+    POLL_INTERVAL_DEFAULT,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .menu_parser import ParsedMenu, parse_menus
+from .models import MenuItem, Order
+from .resilience import CircuitOpenError, TransientError
+from .schedule import compute_menu_update_interval, compute_orders_update_interval
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_ORDERS = "orders"
+SNAPSHOT_MENUS = "menus"
+
+
+def build_order_index(orders: list[Order]) -> dict[str, Order]:
+    """Map YYYY-MM-DD to the first active (not cancelled) order of that date.
+    
+    Orders arrive newest first, so the first order seen for a date wins.
+    Orders without any state are skipped like cancelled ones.
+    """
+    index: dict[str, Order] = {}
+    for order in orders:
+        if not order.date or order.date in index:
+            continue
+        if order.is_active:
+            index[order.date] = order
+    return index
+
+
+def snapshot_store(hass: HomeAssistant, key: str, kind: str) -> Store:
+    """Return the storage helper holding one coordinator snapshot.
+    
+    key is the config entry id for orders and venue_key() for shared menus.
+    """
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{key}.{kind}")
+
+
+def venue_key(venue_id: int) -> str:
+    """Return the storage key of the menus shared by all entries of a venue."""
+    return f"venue_{venue_id}"
+
+
+class _BessaLunchCoordinator(DataUpdateCoordinator, ABC):
+    """Base coordinator that persists its last good result."""
+    
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        storage_key: str,
+        api_client: BessaAPIClient,
+        kind: str,
+    ) -> None:
+        """Initialize."""
+        self.api_client = api_client
+        self._store = snapshot_store(hass, storage_key, kind)
+        
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{kind}",
+            update_interval=POLL_INTERVAL_DEFAULT,
+        )
+    
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last persisted result into the coordinator.
+        
+        Returns True if a snapshot was restored.
+        """
+        try:
+            snapshot = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Could not load stored Bessa data: %s", err)
+            return False
+        
+        if not snapshot:
+            return False
+        
+        try:
+            data = self._decode(snapshot)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid stored Bessa data: %s", err)
+            return False
+        
+        try:
+            await self._async_process_data(data)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Ignoring stored Bessa data that could not be processed: %s", err)
+            return False
+        
+        # Lets the client fall back to the restored data if the API is down
+        self._restore_api_client(data)
+        _LOGGER.debug("Restored %s snapshot from storage", self.name)
+        self.async_set_updated_data(data)
+        return True
+    
+    def as_dict(self) -> dict[str, Any]:
+        """Return the current data in its JSON serializable form."""
+        return self._encode(self.data or {})
+    
+    @abstractmethod
+    def _encode(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert data to its JSON serializable form."""
+    
+    @abstractmethod
+    def _decode(self, stored: dict[str, Any]) -> dict[str, Any]:
+        """Convert the output of _encode back to data."""
+    
+    def _process_data(self, data: dict[str, Any]) -> None:
+        """Build derived structures for new data before listeners see it."""
+    
+    def _restore_api_client(self, data: dict[str, Any]) -> None:
+        """Hand restored data to the API client as its offline fallback."""
+    
+    async def _async_process_data(self, data: dict[str, Any]) -> None:
+        """Run _process_data; subclasses may move the work off the event loop."""
+        self._process_data(data)
+    
+    def _async_save_snapshot(self, data: dict[str, Any]) -> None:
+        """Schedule writing a result to storage."""
+        # Encoded only when the delayed write actually happens
+        self._store.async_delay_save(lambda: self._encode(data), SNAPSHOT_SAVE_DELAY)
+
+
+class BessaLunchMenusCoordinator(_BessaLunchCoordinator):
+    """Class to manage fetching the Bessa menus for the next days.
+    
+    Menus are the same for every account at a venue, so one coordinator is
+    shared by all config entries of the venue (see VenueMenus). It belongs to
+    none of them: it is shut down when the last entry of the venue unloads.
+    """
+    
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        venue_id: int,
+        api_client: BessaAPIClient,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        parse_in_executor: bool = DEFAULT_PARSE_IN_EXECUTOR,
+    ) -> None:
+        """Initialize."""
+        # DataUpdateCoordinator binds itself to the entry being set up and
+        # shuts down when that entry unloads, even if other entries of the
+        # venue still use it. Hide the entry while initializing (the
+        # config_entry argument to opt out only exists in newer releases).
+        token = current_entry.set(None)
+        try:
+            super().__init__(hass, venue_key(venue_id), api_client, SNAPSHOT_MENUS)
+        finally:
+            current_entry.reset(token)
+        self._max_concurrent_requests = max(1, max_concurrent_requests)
+        self._parse_in_executor = parse_in_executor
+        # "menu_YYYY-MM-DD" -> parsed courses, rebuilt once per refresh
+        self.parsed_menus: dict[str, ParsedMenu] = {}
+        # Menu keys whose fetch failed with no earlier answer to fall back on;
+        # the polling schedule must not mistake them for days without a menu
+        self.unknown_days: set[str] = set()
+    
+    def _encode(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert the menu items to dicts."""
+        return {key: [item.to_dict() for item in items] for key, items in data.items()}
+    
+    def _decode(self, stored: dict[str, Any]) -> dict[str, Any]:
+        """Convert stored menu items back to models."""
+        return {
+            key: tuple(MenuItem.from_dict(item) for item in items)
+            for key, items in stored.items()
+        }
+    
+    def _restore_api_client(self, data: dict[str, Any]) -> None:
+        """Seed the menu cache with the restored menus."""
+        for key, items in data.items():
+            self.api_client.menu_cache.seed(key.removeprefix("menu_"), {"items": items})
+    
+    def _process_data(self, data: dict[str, Any]) -> None:
+        """Parse the menu descriptions of all days."""
+        self.parsed_menus = parse_menus(data)
+    
+    async def _async_process_data(self, data: dict[str, Any]) -> None:
+        """Parse the menus, in a worker thread if configured.
+        
+        The result replaces parsed_menus in a single assignment on the event
+        loop, so sensors see either the previous or the new menus in full,
+        never a partly parsed week.
+        """
+        if not self._parse_in_executor:
+            self._process_data(data)
+            return
+        self.parsed_menus = await self.hass.async_add_executor_job(parse_menus, data)
+    
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch menus from API.
+        
+        All menu requests are issued concurrently, limited by the configured
+        concurrency cap. A failing menu day keeps its previous value instead
+        of failing the whole refresh; only when no day could be fetched does
+        the refresh fail.
+        """
+        today = datetime.now().date()
+        target_dates = [
+            (today + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
+            for days_ahead in range(MENU_DAYS)
+        ]
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        
+        async def _limited(date: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.api_client.get_menu(date)
+        
+        try:
+            # Log in once up front so the parallel requests share the token
+            try:
+                await self.api_client.ensure_authenticated()
+            except (TransientError, CircuitOpenError) as err:
+                # API unreachable: each day still falls back to its cached menu
+                _LOGGER.debug("Could not log in before fetching menus: %s", err)
+            menus = await asyncio.gather(
+                *(_limited(date) for date in target_dates),
+                return_exceptions=True,
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            # Handled below like every menu day failing
+            menus = [err] * len(target_dates)
+        
+        previous = self.data or {}
+        result: dict[str, Any] = {}
+        unknown_days: set[str] = set()
+        errors: list[BaseException] = []
+        for target_date, menu_data in zip(target_dates, menus):
+            menu_key = f"menu_{target_date}"
+            if isinstance(menu_data, BaseException):
+                _LOGGER.warning(
+                    "Failed to fetch menu for %s, keeping previous data: %s",
+                    target_date,
+                    menu_data,
+                )
+                errors.append(menu_data)
+                result[menu_key] = previous.get(menu_key, ())
+                if menu_key not in previous or menu_key in self.unknown_days:
+                    unknown_days.add(menu_key)
+            else:
+                # Extract the items array from the menu data
+                result[menu_key] = menu_data.get("items", ())
+        self.unknown_days = unknown_days
+        
+        if len(errors) == len(target_dates):
+            # Nothing answered: keep the previous data and retry at the
+            # default rate instead of sleeping as if there were no menus
+            self.update_interval = POLL_INTERVAL_DEFAULT
+            raise UpdateFailed(f"Error communicating with API: {errors[0]}") from errors[0]
+        
+        await self._async_process_data(result)
+        self._async_save_snapshot(result)
+        
+        # The next refresh is scheduled with the interval set here
+        self.update_interval = compute_menu_update_interval(
+            result, datetime.now(), self.unknown_days
+        )
+        _LOGGER.debug("Next Bessa menu refresh in %s", self.update_interval)
+        return result
+
+
+class BessaLunchOrdersCoordinator(_BessaLunchCoordinator):
+    """Class to manage fetching the Bessa orders."""
+    
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api_client: BessaAPIClient,
+        menus_coordinator: BessaLunchMenusCoordinator,
+    ) -> None:
+        """Initialize."""
+        super().__init__(hass, entry.entry_id, api_client, SNAPSHOT_ORDERS)
+        # Menus decide which days are active for the polling schedule
+        self.menus_coordinator = menus_coordinator
+        # Date -> active order, rebuilt once per refresh
+        self.orders_by_date: dict[str, Order] = {}
+    
+    def _encode(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert the orders to dicts."""
+        return {"orders": [order.to_dict() for order in data.get("orders", ())]}
+    
+    def _decode(self, stored: dict[str, Any]) -> dict[str, Any]:
+        """Convert stored orders back to models."""
+        return {"orders": [Order.from_dict(order) for order in stored.get("orders", [])]}
+    
+    def _restore_api_client(self, data: dict[str, Any]) -> None:
+        """Seed the client's order index with the restored orders."""
+        self.api_client.restore_orders(data.get("orders", []))
+    
+    def _process_data(self, data: dict[str, Any]) -> None:
+        """Index the orders by date."""
+        self.orders_by_date = build_order_index(data.get("orders", []))
+    
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch orders from API."""
+        try:
+            result = await self.api_client.get_today_orders()
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+        
+        self._process_data(result)
+        self._async_save_snapshot(result)
+        
+        # The next refresh is scheduled with the interval set here
+        self.update_interval = compute_orders_update_interval(
+            result.get("orders", []),
+            self.menus_coordinator.data or {},
+            datetime.now(),
+            self.menus_coordinator.unknown_days,
+        )
+        _LOGGER.debug("Next Bessa orders refresh in %s", self.update_interval)
+        return result
+
+
+class VenueMenus:
+    """The menus coordinator and menu cache shared by the entries of a venue.
+    
+    The coordinator fetches with the API client of one of the attached
+    entries; when that entry goes away it switches to another one.
+    """
+    
+    def __init__(self, coordinator: BessaLunchMenusCoordinator) -> None:
+        """Initialize with the coordinator created by the first entry."""
+        self.coordinator = coordinator
+        self.menu_cache = coordinator.api_client.menu_cache
+        self._clients: dict[str, BessaAPIClient] = {}
+    
+    def attach(self, entry_id: str, api_client: BessaAPIClient) -> None:
+        """Register an entry using the shared menus."""
+        self._clients[entry_id] = api_client
+    
+    def detach(self, entry_id: str) -> bool:
+        """Unregister an entry; return True if other entries still use the menus."""
+        api_client = self._clients.pop(entry_id, None)
+        if not self._clients:
+            return False
+        if self.coordinator.api_client is api_client:
+            self.coordinator.api_client = next(iter(self._clients.values()))
+        return True
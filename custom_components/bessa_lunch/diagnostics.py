@@ -0,0 +1,84 @@
+"""Diagnostics support for the Bessa Lunch integration."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_USERNAME,
+    DATA_API_CLIENT,
+    DATA_MENUS_COORDINATOR,
+    DATA_ORDERS_COORDINATOR,
+    DOMAIN,
+    VALIDATION_STRICT,
+)
+from .menu_parser import parser_cache_info
+from .validation import ResponseValidator, SchemaValidationError
+
+TO_REDACT = {
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    "customer",
+    "customer_name",
+    "pickup_code",
+    "number",
+    # The config flow names and identifies entries by the account email
+    "title",
+    "unique_id",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    api_client = data[DATA_API_CLIENT]
+    orders_coordinator = data[DATA_ORDERS_COORDINATOR]
+    menus_coordinator = data[DATA_MENUS_COORDINATOR]
+    
+    # Coordinators only keep the projected menu items; fetch today's full
+    # response so parsing problems can be traced back to the raw payload
+    try:
+        today_menu = await api_client.get_menu(
+            datetime.now().strftime("%Y-%m-%d"), include_raw=True
+        )
+        raw_menu_today = today_menu.get("raw_data")
+    except Exception as err:  # pylint: disable=broad-except
+        raw_menu_today = f"Could not fetch raw menu: {err}"
+    
+    # Check the full payload strictly, independent of the configured mode
+    strict = ResponseValidator(VALIDATION_STRICT)
+    if strict.mode != VALIDATION_STRICT:
+        raw_menu_schema = "pydantic not installed"
+    elif not isinstance(raw_menu_today, dict):
+        raw_menu_schema = "no raw menu"
+    else:
+        try:
+            strict.validate("menu", raw_menu_today)
+            raw_menu_schema = "valid"
+        except SchemaValidationError as err:
+            raw_menu_schema = str(err)
+    
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "parser_cache": parser_cache_info(),
+        "menu_cache": {
+            "hits": api_client.menu_cache.hits,
+            "misses": api_client.menu_cache.misses,
+        },
+        "orders_update_interval": str(orders_coordinator.update_interval),
+        "menus_update_interval": str(menus_coordinator.update_interval),
+        "orders": async_redact_data(orders_coordinator.as_dict(), TO_REDACT),
+        "menus": menus_coordinator.as_dict(),
+        "raw_menu_today": raw_menu_today,
+        "raw_menu_today_schema": raw_menu_schema,
+        "validation": api_client.validator.stats(),
+    }
@@ -0,0 +1,127 @@
+"""Per-date menu cache for the Bessa API client."""
+from __future__ import annotations
+
+import time
+from datetime import date, datetime, timedelta
+from typing import Any
+
+
+class _CacheEntry:
+    """A cached menu together with its HTTP validators."""
+
+    __slots__ = ("fetched_at", "menu", "etag", "last_modified")
+
+    def __init__(
+        self,
+        menu: dict[str, Any],
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """Initialize the entry."""
+        self.fetched_at = time.monotonic()
+        self.menu = menu
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class MenuCache:
+    """Cache menu results per date with distance-dependent TTLs.
+
+    Today's menu changes during the day (available_amount counts down), days
+    further out change rarely, and a date in the past never changes again, so
+    its cached menu is kept without expiry.
+    """
+
+    def __init__(
+        self,
+        today_ttl: timedelta,
+        near_ttl: timedelta,
+        far_ttl: timedelta,
+        near_days: int,
+    ) -> None:
+        """Initialize the cache."""
+        self._today_ttl = today_ttl.total_seconds()
+        self._near_ttl = near_ttl.total_seconds()
+        self._far_ttl = far_ttl.total_seconds()
+        self._near_days = near_days
+        self._entries: dict[str, _CacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _ttl_for(self, date_str: str, today: date) -> float | None:
+        """Return the TTL in seconds for a date, or None if it never expires."""
+        days_ahead = (date.fromisoformat(date_str) - today).days
+        if days_ahead < 0:
+            return None
+        if days_ahead == 0:
+            return self._today_ttl
+        if days_ahead <= self._near_days:
+            return self._near_ttl
+        return self._far_ttl
+
+    def get(self, date_str: str) -> dict[str, Any] | None:
+        """Return the cached menu for a date if it is still fresh."""
+        entry = self._entries.get(date_str)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        ttl = self._ttl_for(date_str, datetime.now().date())
+        if ttl is not None and time.monotonic() - entry.fetched_at >= ttl:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry.menu
+
+    def get_stale(self, date_str: str) -> dict[str, Any] | None:
+        """Return the cached menu for a date even if it has expired."""
+        entry = self._entries.get(date_str)
+        return entry.menu if entry is not None else None
+
+    def validators(self, date_str: str) -> tuple[str | None, str | None]:
+        """Return the (ETag, Last-Modified) of the cached menu, fresh or not."""
+        entry = self._entries.get(date_str)
+        if entry is None:
+            return None, None
+        return entry.etag, entry.last_modified
+
+    def revalidate(self, date_str: str) -> dict[str, Any] | None:
+        """Mark a cached menu as fresh again after a 304 and return it."""
+        entry = self._entries.get(date_str)
+        if entry is None:
+            return None
+        entry.fetched_at = time.monotonic()
+        return entry.menu
+
+    def set(
+        self,
+        date_str: str,
+        menu: dict[str, Any],
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a menu result for a date."""
+        self._entries[date_str] = _CacheEntry(menu, etag, last_modified)
+
+    def seed(self, date_str: str, menu: dict[str, Any]) -> None:
+        """Store an already expired menu, e.g. one restored from storage.
+
+        It is never served as fresh, only by get_stale() while the API is
+        unreachable. Dates already cached and past dates are left alone.
+        """
+        if date_str in self._entries or date.fromisoformat(date_str) < datetime.now().date():
+            return
+        entry = _CacheEntry(menu, None, None)
+        entry.fetched_at = float("-inf")
+        self._entries[date_str] = entry
+
+    def prune(self, keep_days: int) -> None:
+        """Drop past dates older than keep_days to bound memory."""
+        cutoff = datetime.now().date() - timedelta(days=keep_days)
+        for date_str in [d for d in self._entries if date.fromisoformat(d) < cutoff]:
+            del self._entries[date_str]
+
+    def clear(self) -> None:
+        """Drop all cached menus."""
+        self._entries.clear()
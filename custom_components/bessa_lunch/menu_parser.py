@@ -0,0 +1,408 @@
+"""Parser for Bessa menu descriptions.
+
+Kept free of Home Assistant imports so it can be benchmarked and checked
+standalone.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+from .const import PARSER_CACHE_SIZE
+from .models import MenuItem
+
+# Single-pass tokenizer for allergen codes ("(ACG)", "(A/G/L)", "ACG)", "/L)"),
+# slashes, ", " and ";"; text is whatever lies between tokens. Every token
+# starts with one of "/(,;" or an uppercase letter, so the regex engine can
+# skip plain text quickly, and each branch checks the consumed character with
+# a lookbehind. Allergen codes come first so "/L)" is not read as a slash.
+# The other kinds end in an empty marker group reported by match.lastindex.
+_TOKEN_RE = re.compile(
+    r'[/(A-Z,;](?:'
+    r'(?<=[/(])(?<!\w.)[A-Z]{2,10}\)?(?!\w)'
+    r'|(?<=[A-Z])(?<!\w.)[A-Z]{1,9}\)?(?!\w)'
+    r'|(?<=\()[A-Z]{1,10}(?:/[A-Z]{1,10})*\)'
+    r'|(?<=/)[A-Z]\)'
+    r'|(?<=/)(?P<slash>)|(?<=,) (?P<comma>)|(?<=;)(?P<semicolon>))'
+)
+_SLASH, _COMMA, _SEMICOLON = 1, 2, 3  # match.lastindex; None for allergen codes
+_MERGED_BILINGUAL_BOUNDARY_RE = re.compile(r'(?<=[a-z])\s+(?=[A-ZÄÖÜ])')
+
+# Keywords that identify an M6-style combo menu (soup + small salad + dessert placeholder).
+_M6_KEYWORDS = ("kleiner salat", "kleines salat", "suppe / soup", "soup  salat", "salat / salad")
+
+EMPTY_COURSES: Mapping[str, str | None] = MappingProxyType({
+    "soup_de": None, "soup_en": None,
+    "main_dish_de": None, "main_dish_en": None,
+    "dessert_de": None, "dessert_en": None,
+})
+_COURSE_KEYS = (
+    ("soup_de", "soup_en"),
+    ("main_dish_de", "main_dish_en"),
+    ("dessert_de", "dessert_en"),
+)
+
+# A course segment: (start, end, slash offsets, ", " offsets) in the
+# description. end excludes trailing whitespace and a "(" or "/" left in front
+# of the allergen code; start may still point at leading whitespace.
+_Segment = tuple[int, int, list[int], list[int]]
+
+
+def is_m6_combo(description: str) -> bool:
+    """Return True for M6-style combo menus (soup + small salad + dessert placeholder).
+
+    The M6 description is always a generic label like:
+      'Suppe / Soup  Salat / Salad  Dessert'
+      'kleiner Salat mit Suppe und Dessert / small salad with soup and dessert'
+    rather than an actual dish description.
+    """
+    d = description.lower()
+    return any(kw in d for kw in _M6_KEYWORDS) and "dessert" in d
+
+
+def _tokenize(
+    description: str,
+) -> tuple[list[_Segment], _Segment, list[int], bool]:
+    """Split a description at its allergen codes in a single scan.
+
+    Returns the non-empty course segments in front of the allergen codes,
+    the text after the last one as a segment plus its ";" offsets, and
+    whether any allergen code was found.
+    """
+    segments: list[_Segment] = []
+    slashes: list[int] = []
+    commas: list[int] = []
+    semicolons: list[int] = []
+    start = 0
+    found_allergen = False
+    for match in _TOKEN_RE.finditer(description):
+        kind = match.lastindex
+        if kind == _SLASH:
+            slashes.append(match.start())
+        elif kind == _COMMA:
+            commas.append(match.start())
+        elif kind == _SEMICOLON:
+            semicolons.append(match.start())
+        else:
+            found_allergen = True
+            text = description[start:match.start()].rstrip().rstrip("(/").rstrip()
+            if text.strip():
+                end = start + len(text)
+                # Drop separators cut off with the trailing "(" or "/"
+                while slashes and slashes[-1] >= end:
+                    slashes.pop()
+                while commas and commas[-1] + 2 > end:
+                    commas.pop()
+                segments.append((start, end, slashes, commas))
+            slashes, commas, semicolons = [], [], []
+            start = match.end()
+
+    end = start + len(description[start:].rstrip())
+    if commas and commas[-1] + 2 > end:
+        commas.pop()
+    return segments, (start, end, slashes, commas), semicolons, found_allergen
+
+
+def _split_bilingual(
+    description: str, start: int, slash: int, end: int
+) -> tuple[str, str | None]:
+    """Split 'German / English' at a slash into (de, en)."""
+    return description[start:slash].strip(), description[slash + 1:end].strip() or None
+
+
+def _split_at(
+    description: str, start: int, end: int, offsets: list[int], width: int
+) -> list[str]:
+    """Split description[start:end] at separator offsets, dropping empty parts."""
+    parts = []
+    for offset in offsets:
+        part = description[start:offset].strip()
+        if part:
+            parts.append(part)
+        start = offset + width
+    part = description[start:end].strip()
+    if part:
+        parts.append(part)
+    return parts
+
+
+def _split_merged_bilingual_segment(
+    description: str, segment: _Segment
+) -> tuple[tuple[str, str | None], tuple[str, str | None]] | None:
+    """Split a merged "DE / EN DE / EN" segment into two bilingual courses.
+
+    Some Ginko menus miss the allergen separator between soup and main, leaving
+    a single segment with two slashes, e.g.:
+      "Karfiolcremesuppe / Cauliflower cream soup Brokkoli- Mandelrisotto / ..."
+    """
+    start, end, slashes, _ = segment
+    if len(slashes) != 2:
+        return None
+
+    first_slash, second_slash = slashes
+    first_de = description[start:first_slash].strip()
+    middle = description[first_slash + 1:second_slash].strip()
+    second_en = description[second_slash + 1:end].strip()
+    boundary = _MERGED_BILINGUAL_BOUNDARY_RE.search(middle)
+
+    if not first_de or not second_en or not boundary:
+        return None
+
+    first_en = middle[:boundary.start()].strip()
+    second_de = middle[boundary.end():].strip()
+    if not first_en or not second_de:
+        return None
+
+    return (first_de, first_en), (second_de, second_en)
+
+
+def _parse_menu_description(description: str) -> dict[str, str | None]:
+    """Split a combined Bessa menu description into course attributes.
+
+    Handles three encoding formats used by the canteen:
+
+    Format A – bilingual per course with allergen codes as delimiters:
+        'DE soup / EN soup(ALLERGENS) DE main / EN main(ALLERGENS) DE dessert / EN dessert(ALLERGENS)'
+
+    Format B – all-German courses + English block appended at end:
+        'DE soup(A) DE main(A) DE dessert(A) en soup, en main, en dessert'
+
+    Format C – inline English soup name leaks into segment after soup's allergen code:
+        'DE soup(ALLERGENS) EN soup, DE main(ALLERGENS) DE dessert(ALLERGENS) EN main, EN dessert'
+
+    Falls back to German text when no English translation is available.
+    """
+    if not description:
+        return dict(EMPTY_COURSES)
+
+    # Step 1: one scan for allergen codes (segment boundaries), slashes,
+    # ", " and ";"; everything below works on the recorded offsets
+    segments, tail, tail_semicolons, found_allergen = _tokenize(description)
+
+    if not segments:
+        # Friday menus sometimes arrive as just "DE / EN" without any
+        # soup/dessert structure or allergen codes; map those to the main dish.
+        result = dict(EMPTY_COURSES)
+        slashes = tail[2]
+        if not found_allergen and len(slashes) == 1 and not is_m6_combo(description):
+            de, en = _split_bilingual(description, 0, slashes[0], len(description))
+            if de and en:
+                result["main_dish_de"] = de
+                result["main_dish_en"] = en
+        return result
+
+    # Step 2: build (de, en) pairs per course
+    de_parts: list[str] = []
+    en_parts: list[str | None] = []
+
+    for i, segment in enumerate(segments):
+        start, end, slashes, commas = segment
+        if len(slashes) == 2:
+            merged_courses = _split_merged_bilingual_segment(description, segment)
+            if merged_courses is not None:
+                for de, en in merged_courses:
+                    de_parts.append(de)
+                    en_parts.append(en)
+                continue
+
+        # For non-first segments: try inline English-prefix detection FIRST.
+        # Pattern: "english phrase, German Dish Name" where the english prefix
+        # leaked from the previous segment's allergen boundary.
+        # Heuristic: prefix is all-lowercase ASCII (English), suffix starts uppercase (German noun).
+        if i > 0 and commas:
+            ci = commas[0]
+            prefix = description[start:ci].strip()
+            suffix = description[ci + 2:end].strip()
+            if (
+                prefix
+                and prefix.isascii()
+                and prefix[0].islower()
+                and suffix
+                and suffix[0].isupper()
+                and len(prefix.split()) <= 7
+            ):
+                # prefix = English name for the previous course
+                if en_parts and en_parts[-1] is None:
+                    en_parts[-1] = prefix
+                # suffix may itself be bilingual (e.g., "DE main / EN main")
+                suffix_slash = next((s for s in slashes if s > ci), None)
+                if suffix_slash is not None:
+                    de, en = _split_bilingual(description, ci + 2, suffix_slash, end)
+                    de_parts.append(de)
+                    en_parts.append(en)
+                else:
+                    de_parts.append(suffix)
+                    en_parts.append(None)
+                continue
+
+        # Default: bilingual slash split or plain German segment
+        if slashes:
+            de, en = _split_bilingual(description, start, slashes[0], end)
+            de_parts.append(de)
+            en_parts.append(en)
+        else:
+            de_parts.append(description[start:end].strip())
+            en_parts.append(None)
+
+    # Step 3: collapse when ingredient-level allergen codes produced > 3 segments.
+    # Keep first (soup) and last (dessert), merge everything in between as main_dish.
+    if len(de_parts) > 3:
+        de_parts = [de_parts[0], " ".join(de_parts[1:-1]), de_parts[-1]]
+        en_first = en_parts[0]
+        en_middle = next((e for e in en_parts[1:-1] if e), None)
+        en_last = en_parts[-1]
+        en_parts = [en_first, en_middle, en_last]
+
+    # Step 4: assign trailing English block to courses that still lack translation.
+    # Prefer semicolons as separator (courses with commas in names won't be split).
+    tail_start, tail_end, _, tail_commas = tail
+    if tail_end > tail_start and None in en_parts:
+        if tail_semicolons:
+            tail_parts = _split_at(description, tail_start, tail_end, tail_semicolons, 1)
+        else:
+            tail_parts = _split_at(description, tail_start, tail_end, tail_commas, 2)
+        j = 0
+        for i in range(len(de_parts)):
+            if en_parts[i] is None and j < len(tail_parts):
+                en_parts[i] = tail_parts[j]
+                j += 1
+
+    # Step 5: map first three courses to soup / main_dish / dessert.
+    # Fall back to German when no English translation was found.
+    result = dict(EMPTY_COURSES)
+    for (key_de, key_en), de, en in zip(_COURSE_KEYS, de_parts, en_parts):
+        result[key_de] = de
+        result[key_en] = en or de
+    return result
+
+
+def fill_m6_from_reference(
+    descriptions: Sequence[str],
+    parsed: list[Mapping[str, str | None]],
+) -> list[Mapping[str, str | None]]:
+    """For M6 combo items, substitute soup/dessert from the first non-M6 reference item.
+
+    descriptions and parsed hold the description of each menu item and its
+    parsed courses, in menu order.
+
+    M6 is always: same soup as M1/M2/M3/M5 + small salad + same dessert as M1.
+    The M6 description is a generic placeholder and carries no real course info.
+    """
+    return _fill_m6(parsed, [is_m6_combo(description) for description in descriptions])
+
+
+def _fill_m6(
+    parsed: Sequence[Mapping[str, str | None]],
+    m6_flags: Sequence[bool],
+) -> list[Mapping[str, str | None]]:
+    """Apply the M6 substitution given which items are M6 combos."""
+    # Find the reference: first non-M6 item that has a valid soup
+    ref_soup_de = ref_soup_en = ref_dessert_de = ref_dessert_en = None
+    for is_m6, courses in zip(m6_flags, parsed):
+        if not is_m6 and courses.get("soup_de"):
+            ref_soup_de = courses["soup_de"]
+            ref_soup_en = courses["soup_en"] or ref_soup_de
+            ref_dessert_de = courses["dessert_de"]
+            ref_dessert_en = courses["dessert_en"] or ref_dessert_de
+            break
+
+    result = []
+    for is_m6, courses in zip(m6_flags, parsed):
+        if is_m6:
+            updated = dict(courses)
+            if ref_soup_de:
+                updated["soup_de"] = ref_soup_de
+                updated["soup_en"] = ref_soup_en
+            if ref_dessert_de:
+                updated["dessert_de"] = ref_dessert_de
+                updated["dessert_en"] = ref_dessert_en
+            updated["main_dish_de"] = "Kleiner Salat"
+            updated["main_dish_en"] = "Small salad"
+            result.append(updated)
+        else:
+            result.append(courses)
+    return result
+
+
+def _parse_menu_description_frozen(description: str) -> Mapping[str, str | None]:
+    """Parse a description into a read-only mapping safe to share from the cache."""
+    return MappingProxyType(_parse_menu_description(description))
+
+
+_parse_cached = lru_cache(maxsize=PARSER_CACHE_SIZE)(_parse_menu_description_frozen)
+
+
+def parse_menu_description(description: str) -> Mapping[str, str | None]:
+    """Split a combined Bessa menu description into course attributes.
+
+    Memoized version of _parse_menu_description. The same descriptions are
+    parsed over and over (every menu item of every menu sensor, plus the M6
+    reference pass of the order sensors), so results are kept in a bounded
+    LRU cache. The returned mapping is read-only; copy it before modifying.
+    """
+    return _parse_cached(description)
+
+
+def configure_parser_cache(maxsize: int) -> None:
+    """Replace the parser cache with an empty one of the given size."""
+    global _parse_cached  # pylint: disable=global-statement
+    if maxsize == _parse_cached.cache_info().maxsize:
+        return
+    _parse_cached = lru_cache(maxsize=max(0, maxsize))(_parse_menu_description_frozen)
+
+
+def parser_cache_info() -> dict[str, int | None]:
+    """Return hit/miss counters and size of the parser cache for diagnostics."""
+    info = _parse_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedMenu:
+    """Parsed courses of one day's menu.
+
+    items holds the courses of every menu item in menu order, with the M6
+    substitution applied. m6 is the resolved courses of the day's M6 combo
+    (None without one), which is what an ordered M6 shows. primary is the
+    first non-M6 item (M1-style main menu) used for the menu sensor's own
+    course attributes.
+    """
+
+    items: tuple[Mapping[str, str | None], ...]
+    m6: Mapping[str, str | None] | None
+    primary: Mapping[str, str | None]
+
+
+def parse_menu(descriptions: Sequence[str]) -> ParsedMenu:
+    """Parse all item descriptions of a day's menu in one pass."""
+    parsed = [parse_menu_description(description) for description in descriptions]
+    m6_flags = [is_m6_combo(description) for description in descriptions]
+    items = tuple(
+        courses if isinstance(courses, MappingProxyType) else MappingProxyType(courses)
+        for courses in _fill_m6(parsed, m6_flags)
+    )
+    m6 = next((courses for courses, is_m6 in zip(items, m6_flags) if is_m6), None)
+    primary = next(
+        (courses for courses, is_m6 in zip(items, m6_flags) if not is_m6),
+        items[0] if items else EMPTY_COURSES,
+    )
+    return ParsedMenu(items=items, m6=m6, primary=primary)
+
+
+def parse_menus(menus: Mapping[str, Sequence[MenuItem]]) -> dict[str, ParsedMenu]:
+    """Parse the menus of several days (e.g. the coordinator's 7-day window).
+
+    Keys are kept as given, so coordinator data maps directly to results.
+    """
+    return {
+        key: parse_menu([item.description for item in items])
+        for key, items in menus.items()
+    }
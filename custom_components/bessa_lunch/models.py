@@ -0,0 +1,227 @@
+"""Internal models for Bessa orders and menu items.
+
+API responses are converted into these immutable, slotted objects once when
+they arrive; prices are floats, the pickup date and time are split out and
+the latest order state is resolved, so sensors read plain attributes instead
+of digging through nested dicts. to_dict()/from_dict() round-trip through
+the JSON snapshots kept in storage.
+
+This module must not import Home Assistant so the benchmarks can load it.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+# State 9 means cancelled
+STATE_CANCELLED = 9
+
+
+def _to_float(value: Any) -> float:
+    """Convert a decimal string from the API to a float, 0.0 if invalid."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _to_int(value: Any) -> int | None:
+    """Convert a count from the API to an int, None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO timestamp from the API ("Z" suffix included)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class OrderItem:
+    """A meal within an order."""
+
+    name: str | None
+    description: str | None
+    price: float
+    quantity: float
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> OrderItem:
+        """Create an item from an entry of an order's "items"."""
+        return cls(
+            name=data.get("name"),
+            description=data.get("description"),
+            price=_to_float(data.get("price", 0)),
+            quantity=data.get("amount", 1),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OrderItem:
+        """Create an item from to_dict() output."""
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the item as a JSON serializable dict."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "price": self.price,
+            "quantity": self.quantity,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Order:
+    """An order with its pickup date, latest state and meals."""
+
+    id: int
+    venue: int | None
+    date: str  # YYYY-MM-DD of the pickup, "" if unknown
+    pickup_time: str | None  # HH:MM as sent by the API
+    pickup_at: datetime | None
+    state: int | None  # Latest entry of the state history
+    state_timestamp: str | None
+    order_state: int | None
+    pickup_code: str | None
+    number: int | None
+    currency: str
+    payment_method: str | None
+    customer_name: str
+    preorder: bool
+    items: tuple[OrderItem, ...]
+    total_price: float
+    updated: str | None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Order:
+        """Create an order from an entry of the orders endpoint."""
+        raw_date = data.get("date") or ""
+        states = data.get("states") or []
+        current_state = states[0] if states else {}
+        items = tuple(OrderItem.from_api(item) for item in data.get("items") or [])
+        customer = data.get("customer") or {}
+        return cls(
+            id=data["id"],
+            venue=data.get("venue"),
+            date=raw_date[:10],
+            pickup_time=raw_date[11:16] if len(raw_date) > 11 else None,
+            pickup_at=_parse_datetime(raw_date),
+            state=current_state.get("state"),
+            state_timestamp=current_state.get("timestamp"),
+            order_state=data.get("order_state"),
+            pickup_code=data.get("pickup_code"),
+            number=data.get("number"),
+            currency=data.get("currency", "EUR"),
+            payment_method=data.get("payment_method"),
+            customer_name=(
+                f"{customer.get('first_name', '')} {customer.get('last_name', '')}".strip()
+            ),
+            preorder=data.get("preorder", False),
+            items=items,
+            total_price=round(sum(item.price * item.quantity for item in items), 2),
+            updated=data.get("updated"),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Order:
+        """Create an order from to_dict() output."""
+        return cls(
+            **{
+                **data,
+                "pickup_at": _parse_datetime(data.get("pickup_at")),
+                "items": tuple(OrderItem.from_dict(item) for item in data["items"]),
+            }
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the order as a JSON serializable dict."""
+        return {
+            "id": self.id,
+            "venue": self.venue,
+            "date": self.date,
+            "pickup_time": self.pickup_time,
+            "pickup_at": self.pickup_at.isoformat() if self.pickup_at else None,
+            "state": self.state,
+            "state_timestamp": self.state_timestamp,
+            "order_state": self.order_state,
+            "pickup_code": self.pickup_code,
+            "number": self.number,
+            "currency": self.currency,
+            "payment_method": self.payment_method,
+            "customer_name": self.customer_name,
+            "preorder": self.preorder,
+            "items": [item.to_dict() for item in self.items],
+            "total_price": self.total_price,
+            "updated": self.updated,
+        }
+
+    @property
+    def is_active(self) -> bool:
+        """Return True if the order has a state and is not cancelled."""
+        return self.state is not None and self.state != STATE_CANCELLED
+
+    @property
+    def description(self) -> str:
+        """Return the meal descriptions (or names) of all items joined."""
+        return " ".join(item.description or item.name or "" for item in self.items)
+
+
+@dataclass(frozen=True, slots=True)
+class MenuItem:
+    """A meal on a day's menu."""
+
+    id: int | None
+    name: str
+    description: str
+    price: float
+    allergens: str
+    available: int | None
+    category: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any], category: str) -> MenuItem:
+        """Create an item from an entry of a menu category's "items"."""
+        return cls(
+            id=data.get("id"),
+            name=data.get("name", "Unknown"),
+            # The API sends null for items without description or allergens
+            description=data.get("description") or "",
+            price=_to_float(data.get("price", "0")),
+            allergens=data.get("allergens") or "",
+            # Use available_amount, not available
+            available=_to_int(data.get("available_amount")),
+            category=category,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MenuItem:
+        """Create an item from to_dict() output."""
+        return cls(
+            **{
+                **data,
+                "description": data.get("description") or "",
+                "allergens": data.get("allergens") or "",
+            }
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the item as a JSON serializable dict."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "price": self.price,
+            "allergens": self.allergens,
+            "available": self.available,
+            "category": self.category,
+        }
@@ -0,0 +1,134 @@
+"""Retries, backoff and circuit breaking for Bessa API requests."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Statuses worth retrying: rate limiting and server side failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TransientError(Exception):
+    """A request failed in a way that may succeed when retried."""
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the API is considered down."""
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Return the delay before retry number attempt (0 based).
+
+    Uses "full jitter": a random delay between 0 and the exponential
+    backoff, so clients failing at the same time do not retry in lockstep.
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Stop sending requests after repeated failures.
+
+    After failure_threshold consecutive failed requests the circuit opens
+    and requests fail fast with CircuitOpenError. Once reset_timeout has
+    passed a single request is let through as a trial while all others keep
+    failing fast: success closes the circuit again, failure keeps it open
+    for another reset_timeout.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: timedelta) -> None:
+        """Initialize the breaker in the closed state."""
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout.total_seconds()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are being rejected."""
+        return (
+            self._opened_at is not None
+            and time.monotonic() - self._opened_at < self._reset_timeout
+        )
+
+    def before_request(self) -> bool:
+        """Raise CircuitOpenError if no request may be sent right now.
+
+        Returns True if the request is the trial of a half-open circuit; the
+        caller must then call end_trial() once the request has finished.
+        """
+        if self._opened_at is None:
+            return False
+        if self.is_open or self._trial_running:
+            raise CircuitOpenError("Bessa API unavailable, not sending request")
+        self._trial_running = True
+        return True
+
+    def end_trial(self) -> None:
+        """Let the next request through as a trial if the circuit is still open."""
+        self._trial_running = False
+
+    def record_success(self) -> None:
+        """Close the circuit after the API answered."""
+        if self._opened_at is not None:
+            _LOGGER.info("Bessa API reachable again")
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit at the threshold."""
+        self._failures += 1
+        # A failed trial request re-opens right away
+        if self._failures >= self._failure_threshold or self._opened_at is not None:
+            if not self.is_open:
+                _LOGGER.warning(
+                    "Bessa API failing, pausing requests for %s",
+                    timedelta(seconds=self._reset_timeout),
+                )
+            self._opened_at = time.monotonic()
+
+
+async def with_retries(
+    request: Callable[[], Awaitable[_T]],
+    breaker: CircuitBreaker,
+    attempts: int,
+    backoff_base: float,
+    backoff_max: float,
+) -> _T:
+    """Run a request, retrying transient failures with jittered backoff.
+
+    Every attempt passes through the circuit breaker, so an outage detected
+    by one request stops the retries of all others. The breaker counts a
+    request as failed only once its last attempt failed; the trial request
+    of a half-open circuit keeps its slot across its own retries.
+    """
+    trial = False
+    try:
+        for attempt in range(attempts):
+            if not trial:
+                trial = breaker.before_request()
+            try:
+                result = await request()
+            except TransientError as err:
+                if attempt + 1 >= attempts:
+                    breaker.record_failure()
+                    raise
+                delay = backoff_delay(attempt, backoff_base, backoff_max)
+                _LOGGER.debug("%s, retrying in %.1fs", err, delay)
+                await asyncio.sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+    finally:
+        if trial:
+            breaker.end_trial()
+    raise TransientError("No request attempts configured")
@@ -0,0 +1,127 @@
+"""Adaptive polling schedule for the Bessa Lunch coordinator."""
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime, time, timedelta
+from typing import Any
+
+from .const import (
+    ACTIVE_HOURS_END,
+    ACTIVE_HOURS_START,
+    FINAL_ORDER_STATES,
+    MENU_DAYS,
+    PICKUP_WINDOW_AFTER,
+    PICKUP_WINDOW_BEFORE,
+    POLL_INTERVAL_DEFAULT,
+    POLL_INTERVAL_MAX,
+    POLL_INTERVAL_PICKUP,
+)
+from .models import Order
+
+
+def _order_state(order: Order) -> int | None:
+    """Return the current state code of an order."""
+    if order.order_state is not None:
+        return order.order_state
+    return order.state
+
+
+def _pickup_time(order: Order) -> datetime | None:
+    """Return the pickup time of an order as naive local time."""
+    pickup = order.pickup_at
+    if pickup is not None and pickup.tzinfo is not None:
+        pickup = pickup.astimezone().replace(tzinfo=None)
+    return pickup
+
+
+def _pending_pickups(orders: list[Order], now: datetime) -> list[datetime]:
+    """Return today's pickup times of orders that are not finished yet."""
+    pickups = []
+    for order in orders:
+        if _order_state(order) in FINAL_ORDER_STATES:
+            continue
+        pickup = _pickup_time(order)
+        if pickup is not None and pickup.date() == now.date():
+            pickups.append(pickup)
+    return pickups
+
+
+def _next_active_start(
+    menus: dict[str, Any],
+    now: datetime,
+    unknown_days: Collection[str],
+) -> datetime | None:
+    """Return the start of active hours on the next day that has a menu.
+
+    Days in unknown_days (menu keys whose fetch failed) may have a menu and
+    count as active, so an outage does not look like a week without menus.
+    """
+    for days_ahead in range(MENU_DAYS):
+        day = now.date() + timedelta(days=days_ahead)
+        key = f"menu_{day.strftime('%Y-%m-%d')}"
+        if not menus.get(key) and key not in unknown_days:
+            continue
+        start = datetime.combine(day, time(ACTIVE_HOURS_START))
+        end = datetime.combine(day, time(ACTIVE_HOURS_END))
+        if now < end:
+            return max(start, now)
+    return None
+
+
+def _idle_interval(
+    menus: dict[str, Any],
+    now: datetime,
+    unknown_days: Collection[str],
+) -> timedelta:
+    """Return the interval outside of pickup windows."""
+    next_active = _next_active_start(menus, now, unknown_days)
+    if next_active is None:
+        return POLL_INTERVAL_MAX
+    if next_active <= now:
+        return POLL_INTERVAL_DEFAULT
+    return min(next_active - now, POLL_INTERVAL_MAX)
+
+
+def compute_menu_update_interval(
+    menus: dict[str, Any],
+    now: datetime,
+    unknown_days: Collection[str] = (),
+) -> timedelta:
+    """Return how long the menus coordinator should wait before refreshing.
+
+    Menus refresh at the default rate during active hours of days with a menu
+    (or whose menu could not be fetched) and otherwise sleep until the next
+    such day (capped at POLL_INTERVAL_MAX).
+    """
+    return max(_idle_interval(menus, now, unknown_days), POLL_INTERVAL_PICKUP)
+
+
+def compute_orders_update_interval(
+    orders: list[Order],
+    menus: dict[str, Any],
+    now: datetime,
+    unknown_days: Collection[str] = (),
+) -> timedelta:
+    """Return how long the orders coordinator should wait before refreshing.
+
+    Polls fast around the pickup time of today's unfinished orders so state
+    changes like Preparing -> Ready show up within minutes, at the default
+    rate during active hours of days with a menu, and otherwise sleeps until
+    the next day with a menu (capped at POLL_INTERVAL_MAX).
+    """
+    pickups = _pending_pickups(orders, now)
+    for pickup in pickups:
+        window_start = pickup - PICKUP_WINDOW_BEFORE
+        window_end = pickup + PICKUP_WINDOW_AFTER
+        if window_start <= now <= window_end:
+            return POLL_INTERVAL_PICKUP
+
+    interval = _idle_interval(menus, now, unknown_days)
+
+    # Wake up in time for an upcoming pickup window
+    for pickup in pickups:
+        window_start = pickup - PICKUP_WINDOW_BEFORE
+        if now < window_start:
+            interval = min(interval, window_start - now)
+
+    return max(interval, POLL_INTERVAL_PICKUP)
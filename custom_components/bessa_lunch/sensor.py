@@ -1,267 +1,31 @@
 """Sensor platform for Bessa Lunch integration."""
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-import re
-
-from . import BessaLunchDataUpdateCoordinator
-from .const import DOMAIN, DEVICE_NAME, DEVICE_MANUFACTURER, DEVICE_MODEL, ORDER_STATES
-
-_ALLERGEN_RE = re.compile(
-    r'(?:(?<!\w)[/(]?[A-Z]{2,10}\)?(?!\w)|\([A-Z]{1,10}(?:/[A-Z]{1,10})*\)|/[A-Z]\))'
+from .const import (
+    DATA_MENUS_COORDINATOR,
+    DATA_ORDERS_COORDINATOR,
+    DEVICE_MANUFACTURER,
+    DEVICE_MODEL,
+    DEVICE_NAME,
+    DOMAIN,
+    ORDER_STATES,
 )
-_MERGED_BILINGUAL_BOUNDARY_RE = re.compile(r'(?<=[a-z])\s+(?=[A-ZÄÖÜ])')
-
-# Keywords that identify an M6-style combo menu (soup + small salad + dessert placeholder).
-_M6_KEYWORDS = ("kleiner salat", "kleines salat", "suppe / soup", "soup  salat", "salat / salad")
-
-_EMPTY_COURSES: dict[str, str | None] = {
-    "soup_de": None, "soup_en": None,
-    "main_dish_de": None, "main_dish_en": None,
-    "dessert_de": None, "dessert_en": None,
-}
-
-
-def _is_ascii_only(text: str) -> bool:
-    return all(ord(c) < 128 for c in text)
-
-
-def _is_m6_combo(description: str) -> bool:
-    """Return True for M6-style combo menus (soup + small salad + dessert placeholder).
-
-    The M6 description is always a generic label like:
-      'Suppe / Soup  Salat / Salad  Dessert'
-      'kleiner Salat mit Suppe und Dessert / small salad with soup and dessert'
-    rather than an actual dish description.
-    """
-    d = description.lower()
-    return any(kw in d for kw in _M6_KEYWORDS) and "dessert" in d
-
-
-def _split_bilingual(text: str) -> tuple[str, str | None]:
-    """Split 'German / English' into (de, en). Returns (text, None) if no slash."""
-    idx = text.find("/")
-    if idx == -1:
-        return text.strip(), None
-    return text[:idx].strip(), text[idx + 1:].strip() or None
-
-
-def _parse_single_bilingual_main(description: str) -> dict[str, str | None] | None:
-    """Parse a single-course bilingual menu with no allergen markers.
-
-    Friday menus sometimes arrive as just "DE / EN" without any soup/dessert
-    structure or allergen separators. Map those directly to the main dish.
-    """
-    if _is_m6_combo(description) or _ALLERGEN_RE.search(description) or description.count("/") != 1:
-        return None
-
-    de, en = _split_bilingual(description)
-    if not de or not en:
-        return None
-
-    result = dict(_EMPTY_COURSES)
-    result["main_dish_de"] = de
-    result["main_dish_en"] = en
-    return result
-
-
-def _split_merged_bilingual_segment(
-    segment: str,
-) -> tuple[tuple[str, str | None], tuple[str, str | None]] | None:
-    """Split a merged "DE / EN DE / EN" segment into two bilingual courses.
-
-    Some Ginko menus miss the allergen separator between soup and main, leaving
-    a single segment with two slashes, e.g.:
-      "Karfiolcremesuppe / Cauliflower cream soup Brokkoli- Mandelrisotto / ..."
-    """
-    if segment.count("/") != 2:
-        return None
-
-    first_slash = segment.find("/")
-    second_slash = segment.rfind("/")
-    first_de = segment[:first_slash].strip()
-    middle = segment[first_slash + 1:second_slash].strip()
-    second_en = segment[second_slash + 1:].strip()
-    boundary = _MERGED_BILINGUAL_BOUNDARY_RE.search(middle)
-
-    if not first_de or not second_en or not boundary:
-        return None
-
-    first_en = middle[:boundary.start()].strip()
-    second_de = middle[boundary.end():].strip()
-    if not first_en or not second_de:
-        return None
-
-    return (first_de, first_en), (second_de, second_en)
-
-
-def _parse_menu_description(description: str) -> dict[str, str | None]:
-    """Split a combined Bessa menu description into course attributes.
-
-    Handles three encoding formats used by the canteen:
-
-    Format A – bilingual per course with allergen codes as delimiters:
-        'DE soup / EN soup(ALLERGENS) DE main / EN main(ALLERGENS) DE dessert / EN dessert(ALLERGENS)'
-
-    Format B – all-German courses + English block appended at end:
-        'DE soup(A) DE main(A) DE dessert(A) en soup, en main, en dessert'
-
-    Format C – inline English soup name leaks into segment after soup's allergen code:
-        'DE soup(ALLERGENS) EN soup, DE main(ALLERGENS) DE dessert(ALLERGENS) EN main, EN dessert'
-
-    Falls back to German text when no English translation is available.
-    """
-    if not description:
-        return dict(_EMPTY_COURSES)
-
-    single_bilingual_main = _parse_single_bilingual_main(description)
-    if single_bilingual_main is not None:
-        return single_bilingual_main
-
-    # Step 1: split by allergen codes to get raw segments
-    raw_segs: list[str] = []
-    last_pos = 0
-    for m in _ALLERGEN_RE.finditer(description):
-        seg = description[last_pos:m.start()].strip().rstrip("(/").strip()
-        if seg:
-            raw_segs.append(seg)
-        last_pos = m.end()
-    tail = description[last_pos:].strip()
-
-    # Step 2: build (de, en) pairs per course
-    de_parts: list[str] = []
-    en_parts: list[str | None] = []
-
-    for i, seg in enumerate(raw_segs):
-        merged_courses = _split_merged_bilingual_segment(seg)
-        if merged_courses is not None:
-            for de, en in merged_courses:
-                de_parts.append(de)
-                en_parts.append(en)
-            continue
-
-        # For non-first segments: try inline English-prefix detection FIRST.
-        # Pattern: "english phrase, German Dish Name" where the english prefix
-        # leaked from the previous segment's allergen boundary.
-        # Heuristic: prefix is all-lowercase ASCII (English), suffix starts uppercase (German noun).
-        if i > 0:
-            ci = seg.find(", ")
-            if ci > 0:
-                prefix = seg[:ci].strip()
-                suffix = seg[ci + 2:].strip()
-                if (
-                    _is_ascii_only(prefix)
-                    and prefix
-                    and prefix[0].islower()
-                    and suffix
-                    and suffix[0].isupper()
-                    and len(prefix.split()) <= 7
-                ):
-                    # prefix = English name for the previous course
-                    if en_parts and en_parts[-1] is None:
-                        en_parts[-1] = prefix
-                    # suffix may itself be bilingual (e.g., "DE main / EN main")
-                    if "/" in suffix:
-                        de, en = _split_bilingual(suffix)
-                        de_parts.append(de)
-                        en_parts.append(en)
-                    else:
-                        de_parts.append(suffix)
-                        en_parts.append(None)
-                    continue
-
-        # Default: bilingual slash split or plain German segment
-        if "/" in seg:
-            de, en = _split_bilingual(seg)
-            de_parts.append(de)
-            en_parts.append(en)
-        else:
-            de_parts.append(seg)
-            en_parts.append(None)
-
-    # Step 3: collapse when ingredient-level allergen codes produced > 3 segments.
-    # Keep first (soup) and last (dessert), merge everything in between as main_dish.
-    if len(de_parts) > 3:
-        de_parts = [de_parts[0], " ".join(de_parts[1:-1]), de_parts[-1]]
-        en_first = en_parts[0]
-        en_middle = next((e for e in en_parts[1:-1] if e), None)
-        en_last = en_parts[-1]
-        en_parts = [en_first, en_middle, en_last]
-
-    # Step 4: assign trailing English block to courses that still lack translation.
-    # Prefer semicolons as separator (courses with commas in names won't be split).
-    if tail and de_parts:
-        if ";" in tail:
-            tail_parts = [p.strip() for p in tail.split(";") if p.strip()]
-        else:
-            tail_parts = [p.strip() for p in tail.split(", ") if p.strip()]
-        j = 0
-        for i in range(len(de_parts)):
-            if en_parts[i] is None and j < len(tail_parts):
-                en_parts[i] = tail_parts[j]
-                j += 1
-
-    # Step 5: map first three courses to soup / main_dish / dessert.
-    # Fall back to German when no English translation was found.
-    keys = ["soup", "main_dish", "dessert"]
-    result: dict[str, str | None] = {}
-    for i, key in enumerate(keys):
-        if i < len(de_parts):
-            de = de_parts[i]
-            en = en_parts[i] if en_parts[i] else de
-            result[f"{key}_de"] = de
-            result[f"{key}_en"] = en
-        else:
-            result[f"{key}_de"] = None
-            result[f"{key}_en"] = None
-    return result
-
-
-def _fill_m6_from_reference(
-    items: list[dict[str, Any]],
-    parsed: list[dict[str, str | None]],
-) -> list[dict[str, str | None]]:
-    """For M6 combo items, substitute soup/dessert from the first non-M6 reference item.
-
-    M6 is always: same soup as M1/M2/M3/M5 + small salad + same dessert as M1.
-    The M6 description is a generic placeholder and carries no real course info.
-    """
-    # Find the reference: first non-M6 item that has a valid soup
-    ref_soup_de = ref_soup_en = ref_dessert_de = ref_dessert_en = None
-    for item, courses in zip(items, parsed):
-        if not _is_m6_combo(item.get("description", "")) and courses.get("soup_de"):
-            ref_soup_de = courses["soup_de"]
-            ref_soup_en = courses["soup_en"] or ref_soup_de
-            ref_dessert_de = courses["dessert_de"]
-            ref_dessert_en = courses["dessert_en"] or ref_dessert_de
-            break
-
-    result = []
-    for item, courses in zip(items, parsed):
-        if _is_m6_combo(item.get("description", "")):
-            updated = dict(courses)
-            if ref_soup_de:
-                updated["soup_de"] = ref_soup_de
-                updated["soup_en"] = ref_soup_en
-            if ref_dessert_de:
-                updated["dessert_de"] = ref_dessert_de
-                updated["dessert_en"] = ref_dessert_en
-            updated["main_dish_de"] = "Kleiner Salat"
-            updated["main_dish_en"] = "Small salad"
-            result.append(updated)
-        else:
-            result.append(courses)
-    return result
-
+from .coordinator import BessaLunchMenusCoordinator, BessaLunchOrdersCoordinator
+from .menu_parser import ParsedMenu, is_m6_combo, parse_menu, parse_menu_description
+from .models import MenuItem, Order
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -269,29 +33,117 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Bessa Lunch sensors based on a config entry."""
-    coordinator: BessaLunchDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators = hass.data[DOMAIN][entry.entry_id]
+    orders_coordinator: BessaLunchOrdersCoordinator = coordinators[DATA_ORDERS_COORDINATOR]
+    menus_coordinator: BessaLunchMenusCoordinator = coordinators[DATA_MENUS_COORDINATOR]
     
     entities = []
     
     # Add 2 entities for each day (7 days total = 14 entities)
     for days_ahead in range(7):
-        entities.append(BessaLunchDailyOrderSensor(coordinator, entry, days_ahead))
-        entities.append(BessaLunchDailyMenuSensor(coordinator, entry, days_ahead))
+        entities.append(
+            BessaLunchDailyOrderSensor(orders_coordinator, menus_coordinator, entry, days_ahead)
+        )
+        entities.append(BessaLunchDailyMenuSensor(menus_coordinator, entry, days_ahead))
     
     async_add_entities(entities)
 
 
-class BessaLunchDailyOrderSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for daily order status."""
+class _BessaLunchDailySensor(CoordinatorEntity, SensorEntity, ABC):
+    """Base for daily sensors that precompute their state once per update.
+    
+    State and attributes are built when the coordinator delivers new data (and
+    at midnight, when the target date moves) instead of on every property read.
+    """
+    
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._cached_state: str | None = None
+        self._cached_attributes: dict[str, Any] = {}
+        self._unsub_day_change: Callable[[], None] | None = None
+    
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state and track day changes."""
+        await super().async_added_to_hass()
+        self._update_cache()
+        self._schedule_day_change()
+        self.async_on_remove(self._cancel_day_change)
+    
+    def _schedule_day_change(self) -> None:
+        """Schedule the cache rebuild for the next midnight.
+        
+        Target dates come from datetime.now(), the process clock, which may
+        be in another time zone than Home Assistant. Midnight is therefore
+        taken from the same clock rather than from HA's time zone.
+        """
+        tomorrow = datetime.now().date() + timedelta(days=1)
+        midnight = datetime.combine(tomorrow, datetime.min.time()).astimezone()
+        self._unsub_day_change = async_track_point_in_utc_time(
+            self.hass, self._async_handle_day_change, midnight
+        )
+    
+    @callback
+    def _cancel_day_change(self) -> None:
+        """Stop tracking day changes."""
+        if self._unsub_day_change is not None:
+            self._unsub_day_change()
+            self._unsub_day_change = None
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the cached state before writing it."""
+        self._update_cache()
+        super()._handle_coordinator_update()
+    
+    @callback
+    def _async_handle_day_change(self, now: datetime) -> None:
+        """Rebuild the cached state for the new target date."""
+        self._schedule_day_change()
+        self._update_cache()
+        self.async_write_ha_state()
+    
+    def _update_cache(self) -> None:
+        """Compute and store state and attributes."""
+        self._cached_state = self._compute_state()
+        self._cached_attributes = self._compute_attributes()
+    
+    @abstractmethod
+    def _compute_state(self) -> str:
+        """Compute the state of the sensor."""
+    
+    @abstractmethod
+    def _compute_attributes(self) -> dict[str, Any]:
+        """Compute the state attributes."""
+    
+    @property
+    def state(self) -> str | None:
+        """Return the state of the sensor."""
+        return self._cached_state
+    
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes."""
+        return self._cached_attributes
+
+
+class BessaLunchDailyOrderSensor(_BessaLunchDailySensor):
+    """Sensor for daily order status.
+    
+    Updates with the orders coordinator; the menus coordinator is only read
+    to resolve M6 combo courses.
+    """
     
     def __init__(
         self,
-        coordinator: BessaLunchDataUpdateCoordinator,
+        coordinator: BessaLunchOrdersCoordinator,
+        menus_coordinator: BessaLunchMenusCoordinator,
         entry: ConfigEntry,
         days_ahead: int,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
+        self._menus_coordinator = menus_coordinator
         self._entry = entry
         self._days_ahead = days_ahead
         
@@ -307,6 +159,21 @@ class BessaLunchDailyOrderSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_order_day_{days_ahead}"
         self._attr_has_entity_name = True
     
+    async def async_added_to_hass(self) -> None:
+        """Also follow menu updates, which can change M6 courses."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._menus_coordinator.async_add_listener(self._async_handle_menus_update)
+        )
+    
+    @callback
+    def _async_handle_menus_update(self) -> None:
+        """Rebuild the cached state and write it only if it changed."""
+        previous = (self._cached_state, self._cached_attributes)
+        self._update_cache()
+        if (self._cached_state, self._cached_attributes) != previous:
+            self.async_write_ha_state()
+    
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
@@ -318,23 +185,19 @@ class BessaLunchDailyOrderSensor(CoordinatorEntity, SensorEntity):
             entry_type="service",
         )
     
-    @property
-    def state(self) -> str:
-        """Return the state of the sensor."""
+    def _compute_state(self) -> str:
+        """Compute the state of the sensor."""
         order = self._get_order_for_day()
         if not order:
             return "No order"
         
         # Get meal names from order
-        items = order.get("items", [])
-        if items:
-            item_names = [item.get("name", "") for item in items]
-            return ", ".join(filter(None, item_names)) or "Ordered"
+        if order.items:
+            return ", ".join(filter(None, (item.name for item in order.items))) or "Ordered"
         return "Ordered"
     
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _compute_attributes(self) -> dict[str, Any]:
+        """Compute the state attributes."""
         order = self._get_order_for_day()
         target_date = self._get_target_date()
         
@@ -345,65 +208,30 @@ class BessaLunchDailyOrderSensor(CoordinatorEntity, SensorEntity):
         }
         
         if order:
-            # Extract items (actual meals)
-            items = order.get("items", [])
-            meals = []
-            total_price = 0
-            
-            for item in items:
-                meal_info = {
-                    "name": item.get("name"),
-                    "description": item.get("description"),
-                    "price": float(item.get("price", 0)),
-                    "quantity": item.get("amount", 1),
-                }
-                meals.append(meal_info)
-                total_price += float(item.get("price", 0)) * item.get("amount", 1)
-            
-            # Get order state
-            states = order.get("states", [])
-            current_state = states[0] if states else {}
-            order_state_code = order.get("order_state")
-            
-            # Extract date from "date" field
-            order_date = order.get("date", "")
-            pickup_time = order_date[11:16] if len(order_date) > 11 else None
-            
             # Parse courses from the order item's description.
             # If the ordered item is an M6 combo (soup + salad + dessert),
             # substitute the real soup/dessert from the day's full menu.
-            combined_description = ""
-            if len(items) == 1:
-                combined_description = items[0].get("description") or items[0].get("name", "")
-            else:
-                combined_description = " ".join(
-                    item.get("description") or item.get("name", "") for item in items
-                )
+            combined_description = order.description
 
-            courses = _parse_menu_description(combined_description)
-            if _is_m6_combo(combined_description):
-                menu_items = self._get_menu_for_day()
-                if menu_items:
-                    menu_parsed = [_parse_menu_description(m.get("description", "")) for m in menu_items]
-                    filled = _fill_m6_from_reference(menu_items, menu_parsed)
-                    for mitem, mc in zip(menu_items, filled):
-                        if _is_m6_combo(mitem.get("description", "")):
-                            courses = mc
-                            break
+            courses = parse_menu_description(combined_description)
+            if is_m6_combo(combined_description):
+                parsed_menu = self._get_parsed_menu_for_day()
+                if parsed_menu is not None and parsed_menu.m6 is not None:
+                    courses = parsed_menu.m6
 
             attrs.update({
-                "order_id": order.get("id"),
-                "meals": meals,
-                "total_price": round(total_price, 2),
-                "state": current_state.get("state"),
-                "state_name": self._get_state_name(current_state.get("state")),
-                "order_state": ORDER_STATES.get(order_state_code, "Unknown"),
-                "order_state_code": order_state_code,
-                "pickup_time": pickup_time,
-                "pickup_code": order.get("pickup_code"),
-                "number": order.get("number"),
-                "currency": order.get("currency", "EUR"),
-                "payment_method": order.get("payment_method"),
+                "order_id": order.id,
+                "meals": [item.to_dict() for item in order.items],
+                "total_price": order.total_price,
+                "state": order.state,
+                "state_name": self._get_state_name(order.state),
+                "order_state": ORDER_STATES.get(order.order_state, "Unknown"),
+                "order_state_code": order.order_state,
+                "pickup_time": order.pickup_time,
+                "pickup_code": order.pickup_code,
+                "number": order.number,
+                "currency": order.currency,
+                "payment_method": order.payment_method,
                 "menu": combined_description,
                 "soup_de": courses["soup_de"],
                 "soup_en": courses["soup_en"],
@@ -430,31 +258,14 @@ class BessaLunchDailyOrderSensor(CoordinatorEntity, SensorEntity):
         else:
             return target.strftime("%A")
     
-    def _get_order_for_day(self) -> dict[str, Any] | None:
+    def _get_order_for_day(self) -> Order | None:
         """Get order data for the specific day."""
-        if not self.coordinator.data:
-            return None
-        
-        target_date = self._get_target_date()
-        orders = self.coordinator.data.get("orders", [])
-        
-        # Find order for this specific date
-        for order in orders:
-            order_date = order.get("date", "")[:10]
-            if order_date == target_date:
-                # Check if not cancelled (state 9)
-                states = order.get("states", [])
-                if states and states[0].get("state") != 9:
-                    return order
-        
-        return None
+        return self.coordinator.orders_by_date.get(self._get_target_date())
     
-    def _get_menu_for_day(self) -> list[dict[str, Any]]:
-        """Get menu data for the specific day."""
-        if not self.coordinator.data:
-            return []
+    def _get_parsed_menu_for_day(self) -> ParsedMenu | None:
+        """Get the parsed menu for the specific day."""
         target_date = self._get_target_date()
-        return self.coordinator.data.get(f"menu_{target_date}", [])
+        return self._menus_coordinator.parsed_menus.get(f"menu_{target_date}")
 
     def _get_state_name(self, state: int | None) -> str:
         """Convert state number to human-readable name."""
@@ -468,17 +279,17 @@ class BessaLunchDailyOrderSensor(CoordinatorEntity, SensorEntity):
     @property
     def icon(self) -> str:
         """Return the icon of the sensor."""
-        if self.state != "No order":
+        if self._cached_state != "No order":
             return "mdi:checkbox-marked-circle"
         return "mdi:checkbox-blank-circle-outline"
 
 
-class BessaLunchDailyMenuSensor(CoordinatorEntity, SensorEntity):
+class BessaLunchDailyMenuSensor(_BessaLunchDailySensor):
     """Sensor for daily available menu."""
     
     def __init__(
         self,
-        coordinator: BessaLunchDataUpdateCoordinator,
+        coordinator: BessaLunchMenusCoordinator,
         entry: ConfigEntry,
         days_ahead: int,
     ) -> None:
@@ -510,9 +321,8 @@ class BessaLunchDailyMenuSensor(CoordinatorEntity, SensorEntity):
             entry_type="service",
         )
     
-    @property
-    def state(self) -> str:
-        """Return the state of the sensor."""
+    def _compute_state(self) -> str:
+        """Compute the state of the sensor."""
         menu_data = self._get_menu_for_day()
         if not menu_data:
             return "No menu available"
@@ -520,9 +330,8 @@ class BessaLunchDailyMenuSensor(CoordinatorEntity, SensorEntity):
         # Return count of available meals
         return f"{len(menu_data)} meals available"
     
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _compute_attributes(self) -> dict[str, Any]:
+        """Compute the state attributes."""
         menu_data = self._get_menu_for_day()
         target_date = self._get_target_date()
         
@@ -538,29 +347,28 @@ class BessaLunchDailyMenuSensor(CoordinatorEntity, SensorEntity):
             meal_names = []
             
             for item in menu_data:
-                available = item.get("available")
                 meal = {
-                    "name": item.get("name", ""),
-                    "description": item.get("description", ""),
-                    "price": float(item.get("price", 0)),
-                    "available": available,
-                    "category": item.get("category", ""),
-                    "allergens": item.get("allergens", ""),
+                    "name": item.name,
+                    "description": item.description,
+                    "price": item.price,
+                    "available": item.available,
+                    "category": item.category,
+                    "allergens": item.allergens,
                 }
                 meals.append(meal)
                 
                 # Add availability info to name if present
-                meal_name = item.get("name", "")
-                if available is not None:
-                    meal_name = f"{meal_name} ({available} left)"
+                meal_name = item.name
+                if item.available is not None:
+                    meal_name = f"{meal_name} ({item.available} left)"
                 meal_names.append(meal_name)
             
-            # Parse each menu item individually, then apply M6 substitution.
-            all_parsed = [_parse_menu_description(item.get("description", "")) for item in menu_data]
-            all_parsed = _fill_m6_from_reference(menu_data, all_parsed)
+            # Courses of each menu item, parsed once per refresh by the coordinator
+            # with the M6 substitution applied.
+            parsed_menu = self._get_parsed_menu_for_day(menu_data)
 
             # Enrich each meal dict with its own parsed courses.
-            for meal, parsed in zip(meals, all_parsed):
+            for meal, parsed in zip(meals, parsed_menu.items):
                 meal["soup_de"] = parsed["soup_de"]
                 meal["soup_en"] = parsed["soup_en"]
                 meal["main_dish_de"] = parsed["main_dish_de"]
@@ -569,13 +377,9 @@ class BessaLunchDailyMenuSensor(CoordinatorEntity, SensorEntity):
                 meal["dessert_en"] = parsed["dessert_en"]
 
             # Top-level course attributes = first non-M6 item (M1-style primary menu).
-            courses = all_parsed[0] if all_parsed else dict(_EMPTY_COURSES)
-            for item, parsed in zip(menu_data, all_parsed):
-                if not _is_m6_combo(item.get("description", "")):
-                    courses = parsed
-                    break
+            courses = parsed_menu.primary
 
-            combined = menu_data[0].get("description", "") if menu_data else ""
+            combined = menu_data[0].description
 
             attrs.update({
                 "meals": meals,
@@ -615,15 +419,23 @@ class BessaLunchDailyMenuSensor(CoordinatorEntity, SensorEntity):
         else:
             return target.strftime("%A")
     
-    def _get_menu_for_day(self) -> list[dict[str, Any]]:
+    def _get_menu_for_day(self) -> tuple[MenuItem, ...]:
         """Get menu data for the specific day."""
         if not self.coordinator.data:
-            return []
+            return ()
         
         target_date = self._get_target_date()
         menu_key = f"menu_{target_date}"
         
-        return self.coordinator.data.get(menu_key, [])
+        return self.coordinator.data.get(menu_key, ())
+    
+    def _get_parsed_menu_for_day(self, menu_data: tuple[MenuItem, ...]) -> ParsedMenu:
+        """Get the parsed menu for the specific day, parsing menu_data if missing."""
+        target_date = self._get_target_date()
+        parsed_menu = self.coordinator.parsed_menus.get(f"menu_{target_date}")
+        if parsed_menu is None:
+            parsed_menu = parse_menu([item.description for item in menu_data])
+        return parsed_menu
     
     @property
     def icon(self) -> str:
@@ -637,7 +449,7 @@ class BessaLunchTodayOrderSensor(CoordinatorEntity, SensorEntity):
     
     def __init__(
         self,
-        coordinator: BessaLunchDataUpdateCoordinator,
+        coordinator: BessaLunchOrdersCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
@@ -669,9 +481,8 @@ class BessaLunchTodayOrderSensor(CoordinatorEntity, SensorEntity):
         if orders:
             order = orders[0]
             # Get meal information from items array
-            items = order.get("items", [])
-            if items:
-                item_names = [item.get("name", "") for item in items]
+            if order.items:
+                item_names = [item.name for item in order.items]
                 return ", ".join(filter(None, item_names)) or "Order placed"
             return "Order placed"
         return "No order"
@@ -685,45 +496,21 @@ class BessaLunchTodayOrderSensor(CoordinatorEntity, SensorEntity):
         orders = self.coordinator.data.get("orders", [])
         if orders:
             order = orders[0]
-            # Extract items (actual meals)
-            items = order.get("items", [])
-            meals = []
-            total_price = 0
-            
-            for item in items:
-                meal_info = {
-                    "name": item.get("name"),
-                    "description": item.get("description"),
-                    "price": float(item.get("price", 0)),
-                    "quantity": item.get("amount", 1),
-                }
-                meals.append(meal_info)
-                total_price += float(item.get("price", 0)) * item.get("amount", 1)
-            
-            # Get order state
-            states = order.get("states", [])
-            current_state = states[0] if states else {}
-            
-            # Extract date from "date" field
-            order_date = order.get("date", "")
-            pickup_date = order_date[:10] if order_date else None
-            pickup_time = order_date[11:16] if len(order_date) > 11 else None
-            
             return {
-                "order_id": order.get("id"),
-                "venue": order.get("venue"),
-                "meals": meals,
-                "total_price": round(total_price, 2),
-                "state": current_state.get("state"),
-                "state_name": self._get_state_name(current_state.get("state")),
-                "order_timestamp": current_state.get("timestamp"),
-                "pickup_date": pickup_date,
-                "pickup_time": pickup_time,
-                "pickup_code": order.get("pickup_code"),
-                "number": order.get("number"),
-                "customer_name": f"{order.get('customer', {}).get('first_name', '')} {order.get('customer', {}).get('last_name', '')}".strip(),
-                "preorder": order.get("preorder", False),
-                "payment_method": order.get("payment_method"),
+                "order_id": order.id,
+                "venue": order.venue,
+                "meals": [item.to_dict() for item in order.items],
+                "total_price": order.total_price,
+                "state": order.state,
+                "state_name": self._get_state_name(order.state),
+                "order_timestamp": order.state_timestamp,
+                "pickup_date": order.date or None,
+                "pickup_time": order.pickup_time,
+                "pickup_code": order.pickup_code,
+                "number": order.number,
+                "customer_name": order.customer_name,
+                "preorder": order.preorder,
+                "payment_method": order.payment_method,
             }
         return {}
     
@@ -748,7 +535,7 @@ class BessaLunchOrderStatusSensor(CoordinatorEntity, SensorEntity):
     
     def __init__(
         self,
-        coordinator: BessaLunchDataUpdateCoordinator,
+        coordinator: BessaLunchOrdersCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
@@ -806,7 +593,7 @@ class BessaLunchMenuSensor(CoordinatorEntity, SensorEntity):
     
     def __init__(
         self,
-        coordinator: BessaLunchDataUpdateCoordinator,
+        coordinator: BessaLunchMenusCoordinator,
         entry: ConfigEntry,
         days_ahead: int,
     ) -> None:
@@ -863,9 +650,9 @@ class BessaLunchMenuSensor(CoordinatorEntity, SensorEntity):
         meals = []
         for item in menu_data:
             meal = {
-                "name": item.get("name", ""),
-                "description": item.get("description", ""),
-                "price": float(item.get("price", 0)),
+                "name": item.name,
+                "description": item.description,
+                "price": item.price,
             }
             meals.append(meal)
         
@@ -891,15 +678,15 @@ class BessaLunchMenuSensor(CoordinatorEntity, SensorEntity):
         else:
             return target.strftime("%A")
     
-    def _get_menu_for_day(self) -> list[dict[str, Any]]:
+    def _get_menu_for_day(self) -> tuple[MenuItem, ...]:
         """Get menu data for the specific day."""
         if not self.coordinator.data:
-            return []
+            return ()
         
         target_date = self._get_target_date()
         menu_key = f"menu_{target_date}"
         
-        return self.coordinator.data.get(menu_key, [])
+        return self.coordinator.data.get(menu_key, ())
     
     @property
     def icon(self) -> str:
@@ -0,0 +1,155 @@
+"""Schema validation of Bessa API responses against the models in types.py.
+
+Validating every response would be expensive at our poll rates, so the mode
+decides how much is checked:
+
+- strict: every response is validated and a mismatch raises
+  SchemaValidationError (for tests and diagnostics)
+- sampled: one in sample_rate responses per endpoint is validated and a
+  mismatch is logged as schema drift (once per kind, then at debug level)
+- off: nothing is validated (default)
+
+pydantic is optional; without it validation is always off.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from typing import Any
+
+from .const import (
+    VALIDATION_OFF,
+    VALIDATION_SAMPLE_RATE,
+    VALIDATION_SAMPLED,
+    VALIDATION_STRICT,
+)
+
+try:
+    from pydantic import ValidationError
+
+    from .types import MenuResponse, OrdersResponse, TokenResponse
+except ImportError:
+    ValidationError = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Response kind -> pydantic model of the whole response
+_MODELS: dict[str, Any] = (
+    {
+        "login": TokenResponse,
+        "orders": OrdersResponse,
+        "menu": MenuResponse,
+    }
+    if ValidationError is not None
+    else {}
+)
+
+
+class SchemaValidationError(Exception):
+    """Raised in strict mode when a response does not match its schema."""
+
+
+def _parse(model: Any, data: Any) -> Any:
+    """Validate data with a pydantic v2 or v1 model."""
+    validate = getattr(model, "model_validate", None) or model.parse_obj
+    return validate(data)
+
+
+def _summarize(err: Any) -> str:
+    """Return where and why validation failed, without the offending values.
+
+    The full pydantic message quotes the input, which may hold personal
+    order details.
+    """
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in err.errors()
+    )
+
+
+class ResponseValidator:
+    """Validate decoded API responses according to the configured mode.
+
+    The time spent and the last mismatch are tracked per kind for
+    diagnostics.
+    """
+
+    def __init__(
+        self,
+        mode: str = VALIDATION_OFF,
+        sample_rate: int = VALIDATION_SAMPLE_RATE,
+    ) -> None:
+        """Initialize the validator."""
+        if mode != VALIDATION_OFF and ValidationError is None:
+            _LOGGER.debug("pydantic not installed, response validation disabled")
+            mode = VALIDATION_OFF
+        self.mode = mode
+        self._sample_rate = max(1, sample_rate)
+        self._seen: Counter[str] = Counter()
+        self._validated: Counter[str] = Counter()
+        self._failed: Counter[str] = Counter()
+        self._seconds: Counter[str] = Counter()
+        self.last_errors: dict[str, str] = {}
+
+    def _should_validate(self, kind: str) -> bool:
+        """Return True if this response of a kind is to be validated."""
+        if self.mode == VALIDATION_STRICT:
+            return True
+        if self.mode == VALIDATION_SAMPLED:
+            # The first response of each kind is always checked
+            return (self._seen[kind] - 1) % self._sample_rate == 0
+        return False
+
+    def validate(self, kind: str, data: Any) -> Any | None:
+        """Validate a decoded response of a kind ("login", "orders", "menu").
+
+        Returns the parsed pydantic model, or None if the response was not
+        validated or did not match in sampled mode.
+        """
+        model = _MODELS.get(kind)
+        if model is None:
+            return None
+        self._seen[kind] += 1
+        if not self._should_validate(kind):
+            return None
+
+        start = time.perf_counter()
+        try:
+            parsed = _parse(model, data)
+        except ValidationError as err:
+            self._failed[kind] += 1
+            summary = self.last_errors[kind] = _summarize(err)
+            if self.mode == VALIDATION_STRICT:
+                raise SchemaValidationError(f"Unexpected {kind} response: {summary}") from err
+            # Drift persists until the models are updated; warn only once per kind
+            log = _LOGGER.debug if self._failed[kind] > 1 else _LOGGER.warning
+            log("Bessa %s response does not match the expected schema: %s", kind, summary)
+            return None
+        finally:
+            self._validated[kind] += 1
+            self._seconds[kind] += time.perf_counter() - start
+
+        return parsed
+
+    def stats(self) -> dict[str, Any]:
+        """Return the mode and per kind counts and validation cost."""
+        return {
+            "mode": self.mode,
+            "sample_rate": self._sample_rate,
+            "kinds": {
+                kind: {
+                    "responses": self._seen[kind],
+                    "validated": self._validated[kind],
+                    "failed": self._failed[kind],
+                    "total_ms": round(self._seconds[kind] * 1000, 3),
+                    "mean_ms": (
+                        round(self._seconds[kind] * 1000 / self._validated[kind], 3)
+                        if self._validated[kind]
+                        else None
+                    ),
+                }
+                for kind in self._seen
+            },
+            "last_errors": dict(self.last_errors),
+        }